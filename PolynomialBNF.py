@@ -71,7 +71,7 @@ def get_BNF():
         atom = (
                 addop[...] +
                 (
-                        (monoexpr | ident).setParseAction(push_first)
+                        (fn_call | monoexpr | ident).setParseAction(push_first)
                         | Group(lpar + expr + rpar)
                 )
         ).setParseAction(push_unary_minus)
@@ -124,6 +124,13 @@ def evaluate_stack(s):
     op, num_args = s.pop(), 0
     if isinstance(op, tuple):
         op, num_args = op
+        if isinstance(op, Polynomial):
+            # a polynomial called with one argument, p(q) being the composition of p with q
+            if num_args != 1:
+                raise ValueError(f"A polynomial takes exactly one argument, {num_args} given")
+            return op(evaluate_stack(s))
+        if op not in fn:
+            raise ValueError(f"Unknown function '{op}'")
     if op == "unary -":
         return -evaluate_stack(s)
     if op in "+-*/^":
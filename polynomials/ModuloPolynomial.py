@@ -2,6 +2,12 @@ from typing import Any
 
 import polynomials.Monomial
 import polynomials.Polynomial
+import polynomials.composition
+import polynomials.galois
+import polynomials.modular
+import polynomials.ntt
+import polynomials.SubproductTree
+import polynomials.sparse
 
 
 class ModuloPolynomial(polynomials.Polynomial):
@@ -9,23 +15,30 @@ class ModuloPolynomial(polynomials.Polynomial):
     def __init__(self, expr, mod=5):
         super().__init__(expr)
         self.mod = mod
-        # TODO: Monomials coefficients should be integers, not full fractions or floats
         self.__module_monomials()
 
     def __module_monomials(self):
-        self.monomials = list(map(lambda mon: mon % self.mod, self.monomials))
+        """Reduce the coefficients to ints modulo mod, a fraction a/b being reduced to a times the inverse of b
+
+        :raise ValueError: If the denominator of a coefficient is not invertible modulo mod
+        """
+        terms = {}
+        for deg, coef in self._sparse().items():
+            if not isinstance(coef, int):
+                try:
+                    coef = coef.numerator * pow(coef.denominator, -1, self.mod)
+                except ValueError:
+                    raise ValueError(
+                        f"The denominator of the coefficient {coef} is not invertible modulo {self.mod}") from None
+            if coef % self.mod:
+                terms[deg] = coef % self.mod
+        self._terms = polynomials.sparse.pack(terms)
 
     def append(self, other, degree=None):
         if isinstance(other, ModuloPolynomial):
             other = other.to_polynomial()
         super().append(other, degree)
 
-    def reorder(self, reverse=True, with_null_coefs=False, max_deg=None):
-        mono_list = super().reorder(reverse, with_null_coefs, max_deg).monomials
-        if not with_null_coefs:
-            mono_list = list(filter(None, mono_list))
-        return ModuloPolynomial(mono_list, self.mod)
-
     def __repr__(self):
         return f'{self.__class__.__name__}("{super().__str__()}", mod={self.mod})'
 
@@ -36,21 +49,19 @@ class ModuloPolynomial(polynomials.Polynomial):
         if not isinstance(other, ModuloPolynomial):
             if isinstance(other, int):
                 if other == 0:
-                    s_o = self.reorder()
-                    return len(s_o) == 1 and s_o[0] == 0
+                    return self.to_polynomial() == 0
             return False
-        s_o, o_o = self.reorder(), other.reorder()
         if self.mod != other.mod:
-            return len(s_o) == len(o_o) == 1 and s_o[0] == o_o[0] == 0
-        return s_o.to_polynomial() == o_o.to_polynomial()
+            return self.to_polynomial() == 0 and other.to_polynomial() == 0
+        return self.to_polynomial() == other.to_polynomial()
 
     def __mul__(self, other):
         if isinstance(other, (ModuloPolynomial, int)):
             if isinstance(other, int):
-                return ModuloPolynomial(super(ModuloPolynomial, self).__mul__(other), self.mod).reorder()
+                return ModuloPolynomial(super(ModuloPolynomial, self).__mul__(other), self.mod)
             if other.mod == self.mod:
                 res = super(ModuloPolynomial, self).__mul__(other.to_polynomial())
-                return ModuloPolynomial(res, self.mod).reorder()
+                return ModuloPolynomial(res, self.mod)
             else:
                 raise ValueError(f"The Polynomials modulos values don't match: {self.mod}!={other.mod}")
         raise ValueError(f"Cannot multiply {self.__class__.__name__} with objects of type {other.__class__.__name__}")
@@ -59,10 +70,178 @@ class ModuloPolynomial(polynomials.Polynomial):
         if isinstance(other, ModuloPolynomial):
             if other.mod == self.mod:
                 res = super(ModuloPolynomial, self).__add__(other.to_polynomial())
-                return ModuloPolynomial(res, self.mod).reorder()
+                return ModuloPolynomial(res, self.mod)
             else:
                 raise ValueError(f"The Polynomials modulos values don't match: {self.mod}!={other.mod}")
         raise ValueError(f"Cannot add {self.__class__.__name__} to objects of type {other.__class__.__name__}")
 
+    def __sub__(self, other: Any):
+        if isinstance(other, ModuloPolynomial):
+            if other.mod == self.mod:
+                res = super(ModuloPolynomial, self).__sub__(other.to_polynomial())
+                return ModuloPolynomial(res, self.mod)
+            else:
+                raise ValueError(f"The Polynomials modulos values don't match: {self.mod}!={other.mod}")
+        raise ValueError(f"Cannot subtract objects of type {other.__class__.__name__} from {self.__class__.__name__}")
+
+    def __check_mod(self, other):
+        if not isinstance(other, ModuloPolynomial):
+            return ModuloPolynomial(other, self.mod)
+        if other.mod != self.mod:
+            raise ValueError(f"The Polynomials modulos values don't match: {self.mod}!={other.mod}")
+        return other
+
+    def gcd(self, other):
+        """Compute the monic greatest common divisor of two polynomials modulo mod, which must be prime
+
+        Long polynomials are handled with half gcds, see polynomials.modular.half_gcd.
+
+        :rtype: ModuloPolynomial
+        """
+        other = self.__check_mod(other)
+        return ModuloPolynomial(polynomials.Polynomial._from_terms(
+            polynomials.modular.gcd(self._dense(), other._dense(), self.mod)), self.mod)
+
+    def lcm(self, other):
+        """Compute the monic least common multiple of two polynomials modulo mod, which must be prime
+
+        :rtype: ModuloPolynomial
+        """
+        other = self.__check_mod(other)
+        a, b = self._dense(), other._dense()
+        if not a or not b:
+            return ModuloPolynomial(0, self.mod)
+        quot, _ = polynomials.modular.divmod_mod(a, polynomials.modular.gcd(a, b, self.mod), self.mod)
+        res = polynomials.modular.monic(polynomials.modular.mul(quot, b, self.mod), self.mod)
+        return ModuloPolynomial(polynomials.Polynomial._from_terms(res), self.mod)
+
+    def xgcd(self, other):
+        """Compute the greatest common divisor of two polynomials modulo mod, which must be prime, with Bezout's
+        coefficients
+
+        :return: A tuple (gcd, s, t) such that s * self + t * other = gcd, the gcd being monic
+        :rtype: tuple
+        """
+        other = self.__check_mod(other)
+        res = polynomials.modular.xgcd(self._dense(), other._dense(), self.mod)
+        return tuple(ModuloPolynomial(polynomials.Polynomial._from_terms(terms), self.mod) for terms in res)
+
+    def powmod(self, exponent, modulus):
+        """Raise the polynomial to a non negative power modulo another polynomial and mod, which must be prime
+
+        The reductions modulo the polynomial modulus reuse its Newton reciprocal, see polynomials.modular.powmod.
+
+        :param exponent: A non negative int, which can be much larger than the degree of the polynomials
+        :param modulus: A non constant polynomial
+        :rtype: ModuloPolynomial
+        """
+        f = self.__check_mod(modulus)._dense()
+        if len(f) < 2:
+            raise ValueError("The modulus of powmod must be a non constant polynomial")
+        mod, inv = self.mod, pow(f[-1], -1, self.mod)
+        # the remainders modulo f and modulo the monic f / f[-1] are the same
+        res = polynomials.modular.powmod(self._dense(), exponent,
+                                         polynomials.modular.modulus(polynomials.modular.scale(f, inv, mod), mod), mod)
+        return ModuloPolynomial(polynomials.Polynomial._from_terms(res), mod)
+
+    def compose(self, other, modulus=None):
+        """Compose the polynomial with another one modulo mod, which must be prime, see polynomials.composition
+
+        :param other: Any numeric value or a Monomial or any Polynomial
+        :param modulus: A non constant polynomial, if given the result is the remainder of the composition divided
+                        by modulus, computed with Brent and Kung's baby steps giant steps
+        :rtype: ModuloPolynomial
+        """
+        mod, b = self.mod, self.__check_mod(other)._dense()
+        if modulus is None:
+            res = polynomials.composition.compose(self._dense(), b, mod)
+        else:
+            f = self.__check_mod(modulus)._dense()
+            if len(f) < 2:
+                raise ValueError("The modulus of compose must be a non constant polynomial")
+            res = polynomials.composition.compose_mod(self._dense(), b, polynomials.modular.monic(f, mod), mod)
+        return ModuloPolynomial(polynomials.Polynomial._from_terms(res), mod)
+
+    def shift(self, val):
+        """Translate the polynomial modulo mod, which must be prime, composing it with x + val
+
+        :param val: Any numeric value
+        :return: The polynomial self(x + val)
+        :rtype: ModuloPolynomial
+        """
+        return self.compose(polynomials.Polynomial([polynomials.Monomial(1, 1), polynomials.Monomial(val, 0)]))
+
+    def squarefree_decomposition(self):
+        """Split the polynomial into square-free polynomials modulo mod, which must be prime
+
+        The factors whose multiplicity is a multiple of mod vanish from the derivative, they are found from the
+        polynomial in x^mod which remains, see polynomials.galois.squarefree.
+
+        :return: A tuple (lead, factors) where lead is the leading coefficient of the polynomial and factors a list
+                 of tuples (factor, multiplicity) of monic square-free polynomials, coprime with each other and
+                 sorted by multiplicity, whose product raised to the multiplicities times lead is the polynomial
+        :rtype: tuple
+        """
+        if not polynomials.ntt._is_prime(self.mod):
+            raise ValueError(f"Polynomials can only be decomposed modulo a prime, not modulo {self.mod}")
+        a = self._dense()
+        if not a:
+            raise ValueError("The null polynomial has no square-free decomposition")
+        factors = polynomials.galois.squarefree(polynomials.modular.monic(a, self.mod), self.mod)
+        factors.sort(key=lambda item: item[1])
+        return a[-1], [(ModuloPolynomial(polynomials.Polynomial._from_terms(factor), self.mod), multiplicity)
+                       for factor, multiplicity in factors]
+
+    def factor(self):
+        """Factor the polynomial into irreducible polynomials modulo mod, which must be prime
+
+        The square-free parts are split by distinct degree factorization, then by the Cantor-Zassenhaus algorithm
+        or, for small primes, by Berlekamp's algorithm, see polynomials.galois.
+
+        :return: A tuple (lead, factors) where lead is the leading coefficient of the polynomial and factors a list
+                 of tuples (factor, multiplicity) of monic irreducible polynomials, sorted by degree, whose product
+                 raised to the multiplicities times lead is the polynomial
+        :rtype: tuple
+        """
+        if not polynomials.ntt._is_prime(self.mod):
+            raise ValueError(f"Polynomials can only be factored modulo a prime, not modulo {self.mod}")
+        a = self._dense()
+        if not a:
+            raise ValueError("The null polynomial cannot be factored")
+        lead, factors = polynomials.galois.factor(a, self.mod)
+        return lead, [(ModuloPolynomial(polynomials.Polynomial._from_terms(factor), self.mod), multiplicity)
+                      for factor, multiplicity in factors]
+
+    @classmethod
+    def interpolate(cls, points, values, mod=5):
+        """Create the polynomial of lowest degree taking the given values at the given points modulo mod
+
+        :param points: Points in any numeric format, distinct modulo mod
+        :param values: The values at each point, in any numeric format
+        :param mod: A prime
+        :return: The polynomial of degree lower than the number of points, see polynomials.SubproductTree
+        :rtype: ModuloPolynomial
+        """
+        res = polynomials.SubproductTree(points, mod).interpolate(list(values))
+        return cls(polynomials.Polynomial._from_terms(res), mod)
+
+    def multi_eval(self, points):
+        """Evaluate the polynomial at many points modulo mod with a subproduct tree, see polynomials.SubproductTree
+
+        :param points: The points in any numeric format, or a SubproductTree built on them modulo mod which can be
+                       reused to evaluate other polynomials at the same points
+        :return: The values of the polynomial at each point, between 0 and mod - 1
+        :rtype: list
+        """
+        if not isinstance(points, polynomials.SubproductTree):
+            points = polynomials.SubproductTree(points, self.mod)
+        elif points.mod != self.mod:
+            raise ValueError(f"The modulos values don't match: {self.mod}!={points.mod}")
+        if self._is_sparse():
+            terms = self._sparse()
+            return [sum(coef * pow(point, deg, self.mod) for deg, coef in terms.items()) % self.mod
+                    for point in points.points]
+        return points.evaluate(self._dense())
+
     def to_polynomial(self):
-        return polynomials.Polynomial(self.reorder().monomials)
+        return polynomials.Polynomial(self)
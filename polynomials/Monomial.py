@@ -1,18 +1,42 @@
 from fractions import Fraction
+from math import prod
 from typing import Any
 
 import polynomials.Polynomial as Polynomial
 
 
+def exact(value):
+    """Convert a numeric value to an exact coefficient
+
+    ints are kept as they are and fractions with a denominator of 1 are converted to ints, so that polynomials with
+    integer coefficients are computed with plain ints. Other values are approximated by a fractions.Fraction with a
+    denominator of at most 1000000.
+
+    :param value: Any numeric value, or a string representing a number
+    :return: The exact value
+    :rtype: int or Fraction
+    """
+    if isinstance(value, int):
+        return int(value)
+    if not isinstance(value, Fraction):
+        value = Fraction(value).limit_denominator(1000000)
+    return value.numerator if value.denominator == 1 else value
+
+
 class Monomial:
     """Represent a monomial.
 
     A monomial has a coefficient and a degree
     The default value of the degree is 0, but you should provide
     at least a coefficient in any numeric format, it will be converted
-    to a fractions.Fraction type.
+    to an int when it is an integer, else to a fractions.Fraction type.
+    Only inexact coefficients (floats, strings...) are approximated with
+    a denominator of at most 1000000, ints and fractions are kept exact.
     """
 
+    __slots__ = ("coef", "deg")
+    var = "x"
+
     def __init__(self, coef, deg=0):
         """Create a monomial
 
@@ -24,9 +48,8 @@ class Monomial:
             self.coef = coef.coef
             self.deg = coef.deg
         else:
-            self.coef = Fraction(coef).limit_denominator(1000000)
+            self.coef = exact(coef)
             self.deg = int(deg)
-        self.var = "x"
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.coef}, {self.deg})"
@@ -76,7 +99,7 @@ class Monomial:
             other = Monomial(other)
         if not isinstance(other, Monomial):
             raise ValueError("Cannot add monomial to...")  # TODO: Find a best Error message
-        return Monomial(self.coef / other.coef, self.deg - other.deg)
+        return Monomial(Fraction(self.coef, other.coef), self.deg - other.deg)
 
     def __rtruediv__(self, other):
         if isinstance(other, (int, float, Fraction)):
@@ -151,19 +174,18 @@ class Monomial:
         return string
 
     def __call__(self, val: Any):
-        val = Fraction(val).limit_denominator(1000000)
+        val = exact(val)
         return self.coef * (val ** self.deg)
 
     def derive(self, n: int):
-        """Derive the monomial
+        """Derive the monomial, multiplying its coefficient by a falling factorial
 
-        :param n: The number of time the monomial will be derived
+        :param n: The number of time the monomial will be derived, a non negative int
         :type n: int
         :return: The n-th derivative of the monomial
         :rtype: Monomial
         """
-        mono = Monomial(self.deg * self.coef, self.deg - 1)
-        if n == 1:
-            return mono
-        else:
-            return mono.derive(n - 1)
+        if n < 0:
+            raise ValueError("A monomial can only be derived a non negative number of times")
+        # the falling factorial deg (deg - 1) ... (deg - n + 1)
+        return Monomial(self.coef * prod(range(self.deg, self.deg - n, -1)), self.deg - n)
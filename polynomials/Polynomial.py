@@ -3,12 +3,28 @@ from fractions import Fraction
 from typing import Any
 
 import polynomials.Monomial as Monomial
+import polynomials.SubproductTree as SubproductTree
+import polynomials.composition as composition
+import polynomials.dense as dense
+import polynomials.division as division
+import polynomials.euclid as euclid
+import polynomials.factorization as factorization
+import polynomials.interpolation as interpolation
+import polynomials.multiplication as multiplication
+import polynomials.roots as roots
+import polynomials.sparse as sparse
+import polynomials.taylor as taylor
 
 
 class Polynomial:
     """Represent a polynomial.
 
-    A polynomial consists of monomials.
+    A polynomial consists of monomials. A polynomial is normalized when it is created: monomials of the same degree
+    are merged, null coefficients are dropped and its monomials are sorted from the highest degree to the lowest one.
+    Its terms are then stored either as a dense array of coefficients (the coefficient of degree i being at index i,
+    see polynomials.dense) or, for polynomials with few non null coefficients, as a sparse mapping from degrees to
+    coefficients (see polynomials.sparse), and its monomials are only built when they are iterated over. Arithmetic
+    is carried out on the terms, so the result of an operation is normalized at once.
 
     Usage
     -----
@@ -33,18 +49,25 @@ class Polynomial:
         :param expr: A string containing a polynomial expression, any numeric value or a Monomial
         """
         self.var = "x"
-        self.monomials = []
-        if not expr:
-            self.append(Monomial.Monomial(0))
+        self._monomials = []
+        self._terms = None
+        self._normalized = False
+        if isinstance(expr, Polynomial):
+            self._terms = expr._packed()
+        elif isinstance(expr, str):
+            self._terms = self.str_pol(expr)._packed()
         elif isinstance(expr, (list, tuple)):
             for val in expr:
-                self.append(Polynomial(val))
-        elif isinstance(expr, (Monomial.Monomial, Polynomial)):
-            self.append(expr)
-        elif isinstance(expr, str):
-            self.append(self.str_pol(expr))
-        elif isinstance(expr, (Fraction, int, float)):
-            self.append(Monomial.Monomial(expr, 0))
+                self.append(val if isinstance(val, Monomial.Monomial) else Polynomial(val))
+        elif isinstance(expr, (Monomial.Monomial, Fraction, int, float)):
+            self.append(Monomial.Monomial(expr))
+        self._normalize()
+
+    def _normalize(self):
+        """Merge the monomials of the polynomial into its terms and mark it as normalized"""
+        self._packed()
+        self._monomials = None
+        self._normalized = True
 
     def deg(self):
         """The degree of a polynomial is the degree of the non null monomial with the highest degree
@@ -52,11 +75,95 @@ class Polynomial:
         :return: The highest degree within the non null monomials of the polynomial
         :rtype: int
         """
-        return max(
-            filter(lambda mono: mono.coef != 0, self),
-            default=Monomial.Monomial(0),
-            key=lambda mono: mono.deg
-        ).deg
+        terms = self._packed()
+        if isinstance(terms, dict):
+            return max(terms, default=0)
+        return max(len(terms) - 1, 0)
+
+    @property
+    def monomials(self):
+        """The monomials of the polynomial
+
+        When the polynomial is the result of an operation, its monomials are built from its coefficients, from the
+        highest degree to the lowest one.
+
+        :rtype: list
+        """
+        if self._monomials is None:
+            terms = self._terms
+            if isinstance(terms, dict):
+                items = sorted(terms.items(), reverse=True)
+            else:
+                items = ((deg, terms[deg]) for deg in range(len(terms) - 1, -1, -1) if terms[deg])
+            self._monomials = [Monomial.Monomial(coef, deg) for deg, coef in items] or [Monomial.Monomial(0)]
+        return self._monomials
+
+    @monomials.setter
+    def monomials(self, monomials):
+        self._monomials = list(monomials)
+        self._terms = None
+        self._normalized = False
+
+    def _packed(self):
+        """The terms of the polynomial, in the layout chosen by polynomials.sparse.pack
+
+        The returned object is shared with the polynomial and should not be modified.
+
+        :return: A trimmed dense array or a sparse mapping
+        :rtype: list or dict
+        """
+        if self._terms is None:
+            self._terms = sparse.pack(sparse.from_monomials(self._monomials))
+        return self._terms
+
+    def _dense(self):
+        """The dense array of coefficients of the polynomial, see polynomials.dense
+
+        The returned list may be shared with the polynomial and should not be modified.
+
+        :rtype: list
+        """
+        terms = self._packed()
+        return sparse.to_dense(terms) if isinstance(terms, dict) else terms
+
+    def _sparse(self):
+        """The sparse mapping of the coefficients of the polynomial, see polynomials.sparse
+
+        The returned dict may be shared with the polynomial and should not be modified.
+
+        :rtype: dict
+        """
+        terms = self._packed()
+        return terms if isinstance(terms, dict) else sparse.from_dense(terms)
+
+    def _is_sparse(self):
+        return isinstance(self._packed(), dict)
+
+    @classmethod
+    def interpolate(cls, points, values):
+        """Create the polynomial of lowest degree taking the given values at the given points
+
+        :param points: Distinct points, in any numeric format
+        :param values: The values at each point, in any numeric format
+        :return: The polynomial of degree lower than the number of points, see polynomials.interpolation
+        :rtype: Polynomial
+        """
+        return cls._from_terms(interpolation.interpolate(list(points), list(values)))
+
+    @classmethod
+    def _from_terms(cls, terms):
+        """Create a polynomial from its terms, without building its monomials
+
+        :param terms: A trimmed dense array or a sparse mapping without null coefficients, which is not copied
+        :type terms: list or dict
+        :rtype: Polynomial
+        """
+        poly = cls.__new__(cls)
+        poly.var = "x"
+        poly._monomials = None
+        poly._terms = sparse.pack(terms)
+        poly._normalized = True
+        return poly
 
     def append(self, other, degree=None):
         """
@@ -70,14 +177,16 @@ class Polynomial:
         if degree is None:
             if isinstance(other, Monomial.Monomial):
                 self.monomials.append(other)
+                self._terms = None
+                self._normalized = False
             elif isinstance(other, Polynomial):
                 self.monomials.extend(other)
+                self._terms = None
+                self._normalized = False
             else:
                 self.append(Polynomial(other))
         else:
-            mono = Monomial.Monomial(other, degree)
-            mono.var = self.var
-            self.append(mono)
+            self.append(Monomial.Monomial(other, degree))
 
     def __repr__(self):
         return f'{self.__class__.__name__}("{self!s}")'
@@ -134,12 +243,19 @@ class Polynomial:
 
     def __setitem__(self, index, value):
         self.monomials[index] = value
+        self._terms = None
+        self._normalized = False
 
     def __delitem__(self, index):
         del self.monomials[index]
+        self._terms = None
+        self._normalized = False
 
     def pop(self, *args):
-        return self.monomials.pop(*args)
+        mono = self.monomials.pop(*args)
+        self._terms = None
+        self._normalized = False
+        return mono
 
     def __len__(self):
         return len(self.monomials)
@@ -158,61 +274,70 @@ class Polynomial:
         :return: A copy of the polynomial
         :rtype: Polynomial
         """
-        return Polynomial(self.monomials.copy())
+        poly = self.__class__.__new__(self.__class__)
+        poly.__dict__.update(self.__dict__)
+        if poly._monomials is not None:
+            poly._monomials = poly._monomials.copy()
+        return poly
 
     def __eq__(self, other: Any):
         if not isinstance(other, (Monomial.Monomial, Polynomial, int, float, Fraction, str)):
             return False
         if not isinstance(other, Polynomial):
             other = Polynomial(other)
-        reordered_self = self.reorder(with_null_coefs=True)
-        other = other.reorder(with_null_coefs=True)
-        if len(other) != len(reordered_self) or other.deg() != reordered_self.deg():
-            return False
-        return all([reordered_self[i] == other[i] for i in range(len(reordered_self))])
+        if self._is_sparse() or other._is_sparse():
+            return self._sparse() == other._sparse()
+        return self._dense() == other._dense()
 
     def __add__(self, other: Any):
-        self_copy = self.copy()
-        self_copy.append(other)
-        return self_copy.reorder()
+        if not isinstance(other, Polynomial):
+            other = Polynomial(other)
+        if self._is_sparse() or other._is_sparse():
+            return Polynomial._from_terms(sparse.add(self._sparse(), other._sparse()))
+        return Polynomial._from_terms(dense.add(self._dense(), other._dense()))
 
     def __sub__(self, other: Any):
-        return self.__neg__().__add__(other).__neg__()
+        if not isinstance(other, Polynomial):
+            other = Polynomial(other)
+        if self._is_sparse() or other._is_sparse():
+            return Polynomial._from_terms(sparse.sub(self._sparse(), other._sparse()))
+        return Polynomial._from_terms(dense.sub(self._dense(), other._dense()))
 
     def __neg__(self):
-        return Polynomial([-mono for mono in self])
+        if self._is_sparse():
+            return Polynomial._from_terms(sparse.neg(self._sparse()))
+        return Polynomial._from_terms(dense.neg(self._dense()))
 
     def __truediv__(self, other: Any):
+        """Divide the polynomial
+
+        :param other: A number, a Monomial or a Polynomial
+        :return: The quotient when the division is exact or when other is a number, else a tuple (quotient, remainder)
+        """
         if isinstance(other, (int, float, Fraction)):
             other = Monomial.Monomial(other)
             return self * (1 / other)
 
-        if not isinstance(other, Polynomial):
-            other = Polynomial(other)
+        quot, rest = divmod(self, other)
+        if rest == 0:
+            return quot
+        return quot, rest
 
-        if self.deg() < other.deg():
-            return Polynomial(0), self
+    def __divmod__(self, other: Any):
+        """Euclidean division of the polynomial, see polynomials.division
 
-        else:
-            self_copy = self.copy().reorder(with_null_coefs=True)
-            other_copy = other.copy().reorder()
-            quot = Polynomial()
-            m1, m2 = self_copy[0], other_copy[0]
-
-            while self_copy and m1.deg - m2.deg >= 0:
-                m3 = m1 / m2
-                quot.append(m3)
-                max_deg = max(self_copy, key=lambda mono: mono.deg).deg
-                self_copy = (self_copy - other_copy * m3).reorder(reverse=True, with_null_coefs=True, max_deg=max_deg)
-                self_copy.pop(0)
-                m1 = self_copy[0]
-
-            if self_copy == 0:
-                return quot.reorder()
-            return quot.reorder(), self_copy.reorder()
+        :param other: Any numeric value or a Monomial or any Polynomial, which must not be null
+        :return: A tuple (quotient, remainder) such that self = other * quotient + remainder, with
+                 remainder.deg() < other.deg() or a null remainder
+        :rtype: tuple
+        """
+        if not isinstance(other, Polynomial):
+            other = Polynomial(other)
+        quot, rest = division.divmod_dense(self._dense(), other._dense())
+        return Polynomial._from_terms(quot), Polynomial._from_terms(rest)
 
     def __floordiv__(self, other: Any):
-        quotient, _ = self / other
+        quotient, _ = divmod(self, other)
         return quotient
 
     def __mul__(self, other: Any):
@@ -220,16 +345,18 @@ class Polynomial:
             other = Polynomial(other)
 
         if isinstance(other, Monomial.Monomial):
-            poly = Polynomial()
-            for mono in self:
-                poly.append(other * mono)
-            return poly.reorder()
+            if self._is_sparse():
+                return Polynomial._from_terms(sparse.mul_monomial(self._sparse(), other.coef, other.deg))
+            return Polynomial._from_terms(dense.mul_monomial(self._dense(), other.coef, other.deg))
 
         if isinstance(other, Polynomial):
-            poly = Polynomial()
-            for mono in other:
-                poly.append(self * mono)
-            return poly.reorder()
+            if self._is_sparse() and other._is_sparse():
+                a, b = self._sparse(), other._sparse()
+                # the schoolbook product of the terms is only cheaper than the fast dense kernels when it computes
+                # less products than the dense product has coefficients
+                if len(a) * len(b) < max(a) + max(b) + 1:
+                    return Polynomial._from_terms(sparse.mul(a, b))
+            return Polynomial._from_terms(multiplication.mul(self._dense(), other._dense()))
 
     def __rmul__(self, other: Any):
         return self.__mul__(other)
@@ -238,42 +365,285 @@ class Polynomial:
         return self.__add__(other)
 
     def __rsub__(self, other: Any):
-        return self.__sub__(other)
+        return Polynomial(other).__sub__(self)
 
     def __pow__(self, exponent: int):
-        pow_pol = Polynomial(1)
-        for i in range(exponent):
-            pow_pol = pow_pol * self
-        return pow_pol.reorder()
+        if exponent < 0:
+            raise ValueError("A polynomial can only be raised to a non negative integer power")
+        if self._is_sparse():
+            pow_terms, terms = {0: 1}, self._sparse()
+            for bit in bin(exponent)[2:]:
+                pow_terms = sparse.mul(pow_terms, pow_terms)
+                if bit == "1":
+                    pow_terms = sparse.mul(pow_terms, terms)
+            return Polynomial._from_terms(pow_terms)
+        return Polynomial._from_terms(multiplication.power(self._dense(), exponent))
 
     def __bool__(self):
         return bool(self.monomials)
 
     def __mod__(self, other):
-        _, rest = self / other
+        _, rest = divmod(self, other)
         return rest
 
+    def gcd(self, other: Any):
+        """Compute the greatest common divisor of two polynomials, see polynomials.euclid
+
+        :param other: Any numeric value or a Monomial or any Polynomial
+        :return: The monic gcd, or the null polynomial when both polynomials are null
+        :rtype: Polynomial
+        """
+        if not isinstance(other, Polynomial):
+            other = Polynomial(other)
+        return Polynomial._from_terms(euclid.gcd(self._dense(), other._dense()))
+
+    def lcm(self, other: Any):
+        """Compute the least common multiple of two polynomials
+
+        :param other: Any numeric value or a Monomial or any Polynomial
+        :return: The monic lcm, or the null polynomial when one of the polynomials is null
+        :rtype: Polynomial
+        """
+        if not isinstance(other, Polynomial):
+            other = Polynomial(other)
+        return Polynomial._from_terms(euclid.lcm(self._dense(), other._dense()))
+
+    def xgcd(self, other: Any):
+        """Compute the greatest common divisor of two polynomials with Bezout's coefficients
+
+        :param other: Any numeric value or a Monomial or any Polynomial
+        :return: A tuple (gcd, s, t) such that s * self + t * other = gcd, the gcd being monic
+        :rtype: tuple
+        """
+        if not isinstance(other, Polynomial):
+            other = Polynomial(other)
+        return tuple(Polynomial._from_terms(terms) for terms in euclid.xgcd(self._dense(), other._dense()))
+
+    def roots(self, method="aberth"):
+        """Approximate all the complex roots of the polynomial, repeated with their multiplicities
+
+        This method needs NumPy. The coefficients are converted once to float64, then the roots are computed with
+        the Aberth-Ehrlich iteration on arrays of estimates, or with the companion matrix if it does not converge,
+        see polynomials.roots.
+
+        :param method: "aberth", or "companion" to compute the roots as the eigenvalues of the companion matrix
+        :type method: str
+        :return: A complex128 array of deg(self) roots, sorted by real parts then imaginary parts
+        :rtype: numpy.ndarray
+        """
+        a = self._dense()
+        if not a:
+            raise ValueError("The null polynomial has infinitely many roots")
+        return roots.numeric_roots(a, method)
+
+    def real_roots(self, precision=None):
+        """Isolate the distinct real roots of the polynomial with Descartes' rule of signs, see polynomials.roots
+
+        :param precision: A positive int, float or Fraction, if given the isolating intervals are refined until their
+                          width is at most precision
+        :return: The sorted list of tuples (low, high) of Fractions, one for each distinct real root, such that the
+                 root is the only one in the open interval (low, high), or is equal to low if low == high
+        :rtype: list
+        """
+        a = self._dense()
+        if not a:
+            raise ValueError("The null polynomial has infinitely many roots")
+        if precision is not None:
+            # floats are converted exactly, since a small precision would be rounded to 0 by Monomial.exact
+            precision = Fraction(precision)
+            if precision <= 0:
+                raise ValueError("The precision of the roots must be positive")
+        return roots.real_roots(a, precision)
+
+    def squarefree_decomposition(self):
+        """Split the polynomial into square-free polynomials with Yun's algorithm, see polynomials.factorization
+
+        :return: A tuple (content, factors) where content is an int or a Fraction and factors a list of tuples
+                 (factor, multiplicity) of primitive square-free polynomials with a positive leading coefficient,
+                 coprime with each other and sorted by multiplicity, whose product raised to the multiplicities
+                 times content is the polynomial
+        :rtype: tuple
+        """
+        a = self._dense()
+        if not a:
+            raise ValueError("The null polynomial has no square-free decomposition")
+        content, factors = factorization.squarefree_decomposition(a)
+        return content, [(Polynomial._from_terms(factor), multiplicity) for factor, multiplicity in factors]
+
+    def factor(self):
+        """Factor the polynomial into irreducible polynomials with integer coefficients
+
+        The square-free parts are factored modulo a small prime, the factors are lifted with Hensel's lemma and
+        recombined with the algorithm of Zassenhaus, see polynomials.factorization.
+
+        :return: A tuple (content, factors) where content is an int or a Fraction and factors a list of tuples
+                 (factor, multiplicity) of primitive irreducible polynomials with a positive leading coefficient,
+                 sorted by degree, whose product raised to the multiplicities times content is the polynomial
+        :rtype: tuple
+        """
+        a = self._dense()
+        if not a:
+            raise ValueError("The null polynomial cannot be factored")
+        content, factors = factorization.factor(a)
+        return content, [(Polynomial._from_terms(factor), multiplicity) for factor, multiplicity in factors]
+
+    def compose(self, other: Any, modulus: Any = None):
+        """Compose the polynomial with another one, see polynomials.composition
+
+        :param other: Any numeric value or a Monomial or any Polynomial
+        :param modulus: Any non constant Polynomial, if given the result is the remainder of the composition divided
+                        by modulus, computed with Brent and Kung's baby steps giant steps
+        :return: The polynomial self(other)
+        :rtype: Polynomial
+        """
+        if not isinstance(other, Polynomial):
+            other = Polynomial(other)
+        if modulus is None:
+            if self._is_sparse():
+                return sum((other ** deg * coef for deg, coef in self._sparse().items()), Polynomial(0))
+            return Polynomial._from_terms(composition.compose(self._dense(), other._dense()))
+        if not isinstance(modulus, Polynomial):
+            modulus = Polynomial(modulus)
+        f = modulus._dense()
+        if len(f) < 2:
+            raise ValueError("The modulus of compose must be a non constant polynomial")
+        return Polynomial._from_terms(composition.compose_mod(self._dense(), other._dense(), f))
+
+    def shift(self, val: Any):
+        """Translate the polynomial with a Taylor shift, see polynomials.taylor
+
+        :param val: Any numeric value
+        :return: The polynomial self(x + val)
+        :rtype: Polynomial
+        """
+        return Polynomial._from_terms(taylor.shift(self._dense(), Monomial.exact(val)))
+
+    def taylor_at(self, val: Any, order=None):
+        """Evaluate the polynomial and its derivatives at a point
+
+        The coefficients of self(x + val) are the derivatives at val divided by factorials, and the ones of degree
+        lower than order + 1 are found by as many synthetic divisions by x - val, see polynomials.taylor.
+
+        :param val: Any numeric value
+        :param order: The highest derivative computed, a non negative int, the degree of the polynomial by default
+        :return: The list [self(val), self'(val), ..., self^(order)(val)]
+        :rtype: list
+        """
+        a = self._dense()
+        order = max(len(a) - 1, 0) if order is None else order
+        if order < 0:
+            raise ValueError("The order must be a non negative int")
+        res, factorial = [], 1
+        for k, coef in enumerate(taylor.shift(a, Monomial.exact(val), order + 1)):
+            res.append(Monomial.exact(coef * factorial))
+            factorial *= k + 1
+        return res + [0] * (order + 1 - len(res))
+
     def __call__(self, val: Any = Fraction(0)):
+        """Evaluate the polynomial with Horner's rule, see polynomials.dense.horner
+
+        :param val: Any numeric value, a Monomial or any Polynomial to compose the polynomial with it, see compose,
+                    or a variable name to get a copy of the polynomial using this variable
+        :return: The exact value of the polynomial
+        """
+        if isinstance(val, (Polynomial, Monomial.Monomial)):
+            return self.compose(val)
         if str(val).isalpha():
             poly = self.copy()
             poly.var = val
             return poly
-        return sum(map(lambda mono: mono(val), self))
+        val = Monomial.exact(val)
+        if self._is_sparse():
+            return sparse.evaluate(self._sparse(), val)
+        return dense.horner(self._dense(), val)
+
+    def eval_many(self, points, chunk_size=None, exact=False):
+        """Evaluate the polynomial at many points at once with a vectorized Horner's rule
+
+        This method needs NumPy. The coefficients are converted once to float64 (or complex128 for complex points)
+        and every step of Horner's rule is a single operation on a whole array of points.
+
+        :param points: A NumPy array, or any sequence or buffer accepted by numpy.asarray
+        :param chunk_size: If given, the points are evaluated by chunks of this size to bound the memory used by the
+                           temporary arrays, it must be positive
+        :type chunk_size: int
+        :param exact: If True, the points are converted to exact values and the result is an object array of the
+                      exact values of the polynomial, see __call__
+        :type exact: bool
+        :return: An array with the same shape as points
+        :rtype: numpy.ndarray
+        """
+        import numpy as np
+
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError("The chunk size must be a positive int")
+        points = np.asarray(points)
+        flat = points.ravel()
+        if exact:
+            values = [self(val) for val in flat]
+            res = np.empty(len(values), dtype=object)
+            res[:] = values
+            return res.reshape(points.shape)
+
+        dtype = np.complex128 if np.iscomplexobj(points) else np.float64
+        flat = flat.astype(dtype, copy=False)
+        res = np.empty(flat.shape, dtype=dtype)
+        chunk_size = chunk_size or max(len(flat), 1)
+        if self._is_sparse():
+            terms = [(deg, dtype(float(coef))) for deg, coef in self._sparse().items()]
+            for start in range(0, len(flat), chunk_size):
+                chunk = flat[start:start + chunk_size]
+                acc = np.zeros(chunk.shape, dtype=dtype)
+                for deg, coef in terms:
+                    acc += coef * chunk ** deg
+                res[start:start + chunk_size] = acc
+            return res.reshape(points.shape)
+
+        coefs = [float(coef) for coef in reversed(self._dense())] or [0.0]
+        for start in range(0, len(flat), chunk_size):
+            chunk = flat[start:start + chunk_size]
+            acc = np.full(chunk.shape, coefs[0], dtype=dtype)
+            for coef in coefs[1:]:
+                acc *= chunk
+                acc += coef
+            res[start:start + chunk_size] = acc
+        return res.reshape(points.shape)
+
+    def multi_eval(self, points):
+        """Evaluate the polynomial at many points
+
+        The exact values are computed with the integer only Horner's rule of polynomials.dense.horner at each point:
+        the remainders of a subproduct tree over the rationals are as large as all the values together, and the tree
+        was measured slower at every size, 13 s against 0.7 s at 1024 points of 10 bits and degree 1024. Modulo an
+        integer, the values are computed with a subproduct tree, see polynomials.SubproductTree.
+
+        :param points: The points in any numeric format, or a SubproductTree built on them modulo an integer which
+                       can be reused to evaluate other polynomials at the same points
+        :return: The exact values of the polynomial at each point, or their values modulo the modulus of the tree
+        :rtype: list
+        """
+        if isinstance(points, SubproductTree.SubproductTree):
+            return points.evaluate(self._dense())
+        points = [Monomial.exact(point) for point in points]
+        if self._is_sparse():
+            terms = self._sparse()
+            return [sparse.evaluate(terms, point) for point in points]
+        a = self._dense()
+        return [dense.horner(a, point) for point in points]
 
     def derive(self, n=1):
-        """Derive the polynomial
+        """Derive the polynomial in one pass over its coefficients, see polynomials.dense.derive
 
-        :param n: The number of time the polynomial will be derived
-        :return: The n-th derivative of the monomial
+        :param n: The number of time the polynomial will be derived, a non negative int
+        :return: The n-th derivative of the polynomial
         :rtype: Polynomial
         """
-        poly = Polynomial()
-        for mono in self:
-            poly.append(mono.derive(n))
-        return poly.reorder()
+        if n < 0:
+            raise ValueError("A polynomial can only be derived a non negative number of times")
+        if self._is_sparse():
+            return Polynomial._from_terms(sparse.derive(self._sparse(), n))
+        return Polynomial._from_terms(dense.derive(self._dense(), n))
 
-    # TODO: Separate 'reduce' and 'order' so that reduce will just add Monomial with same degree together and order will
-    #  order monomials
     def reorder(self, reverse=True, with_null_coefs=False, max_deg=None):
         """Reorder the polynomial in order to have increasing or decreasing degrees of the monomials
 
@@ -285,36 +655,24 @@ class Polynomial:
         :param max_deg: The highest degree. The polynomial will be truncated and only monomial which degree are less or
                         equal to max_max_deg will be kept.
         :type max_deg: int
-        :return: A polynomial with reordered monomial
+        :return: A polynomial with reordered monomial, which is only normalized when the default arguments are used
         :rtype: Polynomial
         """
-        monomials_list = []
-        rg = range(self.deg() if max_deg is None else max_deg + 1)
-        if reverse:
-            rg = range(self.deg() if max_deg is None else max_deg, -1, -1)
-        for i in rg:
-            m_l = [mono for mono in self if mono.deg == i]
-
-            mono = Monomial.Monomial(0, i)
-            for mon in m_l:
-                mono = mono + mon
-            if with_null_coefs or (mono != 0):
-                monomials_list.append(mono)
-
-        if max_deg:
-            return Polynomial(monomials_list)
-
-        # trimming unnecessary null monomials
-        stop = len(monomials_list)
-        if reverse:
-            monomials_list.reverse()
-        for i in range(stop + 1):
-            if not any(monomials_list[i:stop]):
-                monomials_list = monomials_list[0:i]
-                break
-        if reverse:
-            monomials_list.reverse()
-        return Polynomial(monomials_list)
+        poly = self.copy()
+        if reverse and not with_null_coefs and max_deg is None:
+            if not poly._normalized:
+                poly._normalize()
+            return poly
+        if not with_null_coefs and max_deg is None:
+            items = sorted(self._sparse().items())
+            poly.monomials = [Monomial.Monomial(coef, deg) for deg, coef in items]
+            return poly
+        coefs = self._dense()
+        if max_deg is not None:
+            coefs = coefs[:max_deg + 1] + [0] * (max_deg + 1 - len(coefs))
+        degrees = range(len(coefs) - 1, -1, -1) if reverse else range(len(coefs))
+        poly.monomials = [Monomial.Monomial(coefs[i], i) for i in degrees if with_null_coefs or coefs[i]]
+        return poly
 
     @staticmethod
     def str_pol(expression):
@@ -333,11 +691,11 @@ class Polynomial:
             mono = mono_coef_string + '1' if mono_coef_string in ('+', '-') else mono_coef_string \
                 if mono_coef_string else '1'
             if mon.group('var'):
-                coef = Fraction(mono)
+                coef = Monomial.exact(Fraction(mono))
                 deg = int(mon.group('deg')) if mon.group('deg') else 1
                 monomials_list.append(Monomial.Monomial(coef, deg))
             elif mon.group('coef'):
-                coef = Fraction(mono)
+                coef = Monomial.exact(Fraction(mono))
                 deg = 0
                 monomials_list.append(Monomial.Monomial(coef, deg))
         return Polynomial(monomials_list)
@@ -1,13 +1,89 @@
+from fractions import Fraction
 from typing import Any
 import polynomials.Polynomial
 
+# In lazy mode, a result is only reduced once its size, the sum of the degrees of its numerator and denominator,
+# exceeds the size of its reduced operands by more than max(size, LAZY_THRESHOLD)
+LAZY_THRESHOLD = 16
+
 
 class RationalPolynomial:
-    def __init__(self, numerator, denominator: Any = 1):
+    """Represent a rational function, the quotient of two polynomials.
+
+    A rational polynomial is kept in lowest terms: its numerator and denominator have no common factor and its
+    denominator is monic. Sums are computed over the least common multiple of the denominators and products cancel
+    the common factors of each numerator with the other denominator, as in Henrici's algorithms, so that the gcds are
+    computed on the smallest possible polynomials.
+
+    In lazy mode, the results of the operations are formed with plain products and only reduced when their degree
+    grows past LAZY_THRESHOLD, which saves the gcds of the pipelines where few factors cancel. The reduce method
+    forces the reduction.
+    """
+
+    def __init__(self, numerator, denominator: Any = 1, lazy=False):
+        """Create the rational polynomial numerator / denominator, in lowest terms
+
+        :param numerator: Any numeric value or a Monomial or any Polynomial or a polynomial expression
+        :param denominator: Any numeric value or a Monomial or any Polynomial or a polynomial expression, not null
+        :param lazy: If True, the results of the operations with this rational polynomial are only reduced when
+                     their degree grows past LAZY_THRESHOLD
+        :type lazy: bool
+        """
         self.numerator = numerator if isinstance(numerator, polynomials.Polynomial)\
             else polynomials.Polynomial(numerator)
         self.denominator = denominator if isinstance(denominator, polynomials.Polynomial) \
             else polynomials.Polynomial(denominator)
+        if self.denominator == 0:
+            raise ZeroDivisionError("The denominator of a rational polynomial cannot be null")
+        self.lazy = lazy
+        self._reduce()
+
+    @classmethod
+    def _from_parts(cls, numerator, denominator, lazy, reduced_size=None):
+        """Create a rational polynomial from the polynomials of a result, without reducing it
+
+        :param reduced_size: The size of the reduced operands of the result, None if the result is in lowest terms
+        """
+        res = cls.__new__(cls)
+        res.numerator, res.denominator, res.lazy = numerator, denominator, lazy
+        if reduced_size is None:
+            res._reduced_size = res._size()
+        else:
+            res._reduced_size = reduced_size
+            size = res._size()
+            if size > reduced_size + max(reduced_size, LAZY_THRESHOLD):
+                res._reduce()
+        return res
+
+    def _size(self):
+        return self.numerator.deg() + self.denominator.deg()
+
+    def _reduce(self):
+        """Divide the numerator and the denominator by their gcd and make the denominator monic, in place"""
+        if self.numerator == 0:
+            self.numerator, self.denominator = polynomials.Polynomial(0), polynomials.Polynomial(1)
+        else:
+            g = self.numerator.gcd(self.denominator)
+            if g != 1:
+                self.numerator, self.denominator = self.numerator // g, self.denominator // g
+            lead = self.denominator._dense()[-1]
+            if lead != 1:
+                inverse = Fraction(1) / lead
+                self.numerator, self.denominator = self.numerator * inverse, self.denominator * inverse
+        self._reduced_size = self._size()
+
+    def reduce(self):
+        """The same rational polynomial in lowest terms, which only differs from self in lazy mode
+
+        :rtype: RationalPolynomial
+        """
+        return RationalPolynomial(self.numerator, self.denominator, self.lazy)
+
+    def _coerce(self, other):
+        if not isinstance(other, RationalPolynomial):
+            return RationalPolynomial(other, lazy=self.lazy)
+        # the operations of the eager mode expect operands in lowest terms
+        return other.reduce() if other.lazy and not self.lazy else other
 
     def __str__(self):
         return f"({self.numerator!s})/({self.denominator!s})"
@@ -15,29 +91,78 @@ class RationalPolynomial:
     def __repr__(self):
         return f'{self.__class__.__name__}("{self.numerator!s}", "{self.denominator!s}")'
 
+    def __eq__(self, other: Any):
+        if not isinstance(other, (RationalPolynomial, polynomials.Polynomial, int, float, Fraction, str)):
+            return False
+        other = self._coerce(other)
+        return self.numerator * other.denominator == other.numerator * self.denominator
+
+    def __bool__(self):
+        return self.numerator != 0
+
     def __neg__(self):
-        return RationalPolynomial(-self.numerator, self.denominator)
+        return RationalPolynomial._from_parts(-self.numerator, self.denominator, self.lazy, self._reduced_size)
 
     def __sub__(self, other):
-        if not isinstance(other, RationalPolynomial):
-            other = RationalPolynomial(other)
-        return -other + self
+        return -self._coerce(other) + self
+
+    def __rsub__(self, other):
+        return -self + other
 
     def __add__(self, other):
-        if not isinstance(other, RationalPolynomial):
-            other = RationalPolynomial(other)
-        ds, do = self.denominator, other.denominator
-        return RationalPolynomial(self.numerator * do + other.numerator * ds, ds * do)
+        other = self._coerce(other)
+        ns, no, ds, do = self.numerator, other.numerator, self.denominator, other.denominator
+        if self.lazy:
+            return RationalPolynomial._from_parts(ns * do + no * ds, ds * do, True,
+                                                  max(self._reduced_size, other._reduced_size))
+        # for reduced operands, the gcd of the sum over lcm(ds, do) with this lcm divides g = gcd(ds, do)
+        g = ds.gcd(do)
+        if g == 1:
+            return RationalPolynomial._from_parts(ns * do + no * ds, ds * do, False)
+        ds_g = ds // g
+        num = ns * (do // g) + no * ds_g
+        if num == 0:
+            return RationalPolynomial(0)
+        h = num.gcd(g)
+        if h != 1:
+            num, do = num // h, do // h
+        return RationalPolynomial._from_parts(num, ds_g * do, False)
+
+    def __radd__(self, other):
+        return self + other
 
     def __mul__(self, other):
-        if not isinstance(other, RationalPolynomial):
-            other = RationalPolynomial(other)
-        return RationalPolynomial(self.numerator * other.numerator, self.denominator * other.denominator)
+        other = self._coerce(other)
+        ns, no, ds, do = self.numerator, other.numerator, self.denominator, other.denominator
+        if self.lazy:
+            return RationalPolynomial._from_parts(ns * no, ds * do, True,
+                                                  max(self._reduced_size, other._reduced_size))
+        if ns == 0 or no == 0:
+            return RationalPolynomial(0)
+        # the numerators and denominators of reduced operands have no common factor, so the product is reduced once
+        # each numerator is divided by its gcd with the other denominator
+        g1, g2 = ns.gcd(do), no.gcd(ds)
+        if g1 != 1:
+            ns, do = ns // g1, do // g1
+        if g2 != 1:
+            no, ds = no // g2, ds // g2
+        return RationalPolynomial._from_parts(ns * no, ds * do, False)
+
+    def __rmul__(self, other):
+        return self * other
 
     def __truediv__(self, other):
-        if not isinstance(other, RationalPolynomial):
-            other = RationalPolynomial(other)
-        return RationalPolynomial(self.numerator * other.denominator, self.denominator * other.numerator)
+        other = self._coerce(other)
+        if other.numerator == 0:
+            raise ZeroDivisionError("Cannot divide by a null rational polynomial")
+        # the inverse of other keeps its numerator and denominator coprime, but its denominator is not monic
+        lead = other.numerator._dense()[-1]
+        inverse = Fraction(1) / lead
+        return self * RationalPolynomial._from_parts(other.denominator * inverse, other.numerator * inverse,
+                                                     other.lazy, other._reduced_size)
+
+    def __rtruediv__(self, other):
+        return self._coerce(other) / self
 
 
 if __name__ == "__main__":
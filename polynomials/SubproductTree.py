@@ -0,0 +1,96 @@
+import polynomials.Monomial as Monomial
+import polynomials.modular as modular
+
+# Below this number of points, the remainders are evaluated with Horner's rule
+LEAF_SIZE = 8
+
+
+class SubproductTree:
+    """Represent a set of points modulo an integer, with the products of the (x - point) factors over its subsets.
+
+    The leaves of the tree are the dense arrays of the (x - point) factors modulo mod and each node is the product of
+    its two children, so the root is the product of all of them. A polynomial is evaluated at every point by reducing
+    it modulo the root, then reducing each remainder modulo the children of its node down to the leaves, which costs
+    O(n log^2 n) operations instead of the O(n * m) operations of Horner's rule at each of the m points.
+
+    Modulo a prime, the same tree interpolates the polynomial of degree lower than n taking given values at the n
+    points, by combining the values divided by the derivative of the root from the leaves up to the root.
+
+    Building the tree is the most expensive step, so the same tree should be kept to evaluate several polynomials at
+    the same points.
+    """
+
+    def __init__(self, points, mod):
+        """Build the subproduct tree of a set of points
+
+        :param points: The points, in any numeric format, they are converted to ints or fractions like coefficients
+        :type points: iterable
+        :param mod: The modulus the points and the polynomials evaluated with this tree are reduced by
+        :type mod: int
+        """
+        self.mod = mod
+        self.points = [modular.reduce_coef(Monomial.exact(point), mod) for point in points]
+        # levels[0] holds the leaves and levels[-1] the root, the children of levels[k + 1][j] being levels[k][2 * j]
+        # and levels[k][2 * j + 1], when the latter exists
+        self.levels = [[modular.reduce([-point, 1], mod) for point in self.points]]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            self.levels.append([modular.mul(level[i], level[i + 1], mod) if i + 1 < len(level) else level[i]
+                                for i in range(0, len(level), 2)])
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.points}, mod={self.mod})"
+
+    def __len__(self):
+        return len(self.points)
+
+    def evaluate(self, a):
+        """Evaluate a dense array at every point of the tree
+
+        :param a: A dense array of ints and fractions
+        :type a: list
+        :return: The values modulo mod at each point, in the order of the points
+        :rtype: list
+        """
+        if not self.points:
+            return []
+        mod = self.mod
+        rests = [modular.divmod_mod(modular.from_rational(a, mod), self.levels[-1][0], mod)[1]]
+        # the node at levels[k][j] holds the points from j * 2^k to (j + 1) * 2^k
+        k = len(self.levels) - 1
+        while k and 1 << k > LEAF_SIZE:
+            k -= 1
+            rests = [modular.divmod_mod(rests[j // 2], node, mod)[1] for j, node in enumerate(self.levels[k])]
+        size = 1 << k
+        values = []
+        for i, point in enumerate(self.points):
+            acc = 0
+            for coef in reversed(rests[i // size]):
+                acc = (acc * point + coef) % mod
+            values.append(acc)
+        return values
+
+    def interpolate(self, values):
+        """Compute the polynomial of degree lower than the number of points taking the given values, modulo mod
+
+        This method needs a tree built modulo a prime, on points which are distinct modulo this prime.
+
+        :param values: The values at each point, as ints or fractions
+        :type values: list
+        :return: The dense array of the polynomial modulo mod
+        :rtype: list
+        """
+        if not self.points:
+            return []
+        mod = self.mod
+        root = self.levels[-1][0]
+        weights = self.evaluate(modular.reduce([i * coef for i, coef in enumerate(root)][1:], mod))
+        if 0 in weights:
+            raise ValueError(f"The interpolation points must be distinct modulo {mod}")
+        # the Lagrange interpolant is the sum of the values[i] / weights[i] * root / (x - points[i])
+        rests = [modular.reduce([modular.reduce_coef(value, mod) * pow(weight, -1, mod)], mod)
+                 for value, weight in zip(values, weights)]
+        for level in self.levels[:-1]:
+            rests = [modular.add(modular.mul(rests[i], level[i + 1], mod), modular.mul(rests[i + 1], level[i], mod),
+                                 mod) if i + 1 < len(level) else rests[i] for i in range(0, len(level), 2)]
+        return rests[0]
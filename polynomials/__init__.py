@@ -2,3 +2,4 @@ from .Monomial import Monomial
 from .Polynomial import Polynomial
 from .ModuloPolynomial import ModuloPolynomial
 from .RationalPolynomial import RationalPolynomial
+from .SubproductTree import SubproductTree
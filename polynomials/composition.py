@@ -0,0 +1,130 @@
+"""Composition of dense arrays, the computation of the coefficients of a(b(x)).
+
+Horner's rule on arrays, a(b) = (...(a_n b + a_(n-1)) b + ...) b + a_0, multiplies a growing array by the short b
+at each step, which cannot take advantage of the fast multiplication kernels. From HORNER_THRESHOLD coefficients,
+a is instead split in halves, a = low + x^h high, and a(b) = low(b) + b^h high(b), the powers b^(2^k) being
+computed once: the products are then balanced, and computed with polynomials.multiplication. Over the rationals,
+the coefficients of a(b) grow like those of b^n, and Horner's rule was measured faster when b has less than
+SPLIT_THRESHOLD coefficients: 5.1 s against 9.4 s for the split with 1000 coefficients in a and 5 in b, but 48 s
+against 10 s with 300 and 30. The composition with an array of degree 1 is a Taylor shift, see polynomials.taylor.
+
+Modulo a third array f, the composition is computed with the baby steps giant steps of Brent and Kung: with
+m = isqrt(len(a)) + 1, the powers b^i mod f for i <= m are computed once, a is cut in blocks of m coefficients
+and each block evaluated at b is a linear combination of these powers. The blocks are then combined with Horner's
+rule in b^m mod f, so only about 2 sqrt(n) products modulo f are needed instead of n. Modulo a prime, the powers
+are packed like the slots of a Kronecker substitution (see polynomials.kronecker), so each linear combination is a
+sum of small multiples of big ints.
+
+Every function works on arrays of ints and fractions, or modulo a prime p when it is given.
+"""
+from math import isqrt
+
+import polynomials.Monomial as Monomial
+import polynomials.dense as dense
+import polynomials.division as division
+import polynomials.kronecker as kronecker
+import polynomials.modular as modular
+import polynomials.multiplication as multiplication
+import polynomials.taylor as taylor
+
+HORNER_THRESHOLD = 8
+SPLIT_THRESHOLD = 8
+
+
+def _add(a, b, p):
+    return dense.add(a, b) if p is None else modular.add(a, b, p)
+
+
+def _mul(a, b, p):
+    return multiplication.mul(a, b) if p is None else modular.mul(a, b, p)
+
+
+def horner(a, b, p=None):
+    """Compose two dense arrays with Horner's rule
+
+    :rtype: list
+    """
+    res = []
+    for coef in reversed(a):
+        res = _add(_mul(res, b, p), [coef], p)
+    return res
+
+
+def compose(a, b, p=None):
+    """Compose two dense arrays, splitting a in halves
+
+    :param p: A prime, the arrays being reduced modulo p, or None
+    :return: The array of a(b)
+    :rtype: list
+    """
+    if p is None and len(b) == 2:
+        # a(b_1 x + b_0) is the Taylor shift a(y + b_0) at y = b_1 x
+        res, power = [], 1
+        for coef in taylor.shift(a, b[0]):
+            res.append(Monomial.exact(coef * power))
+            power *= b[1]
+        return res
+    if len(a) <= HORNER_THRESHOLD or len(b) <= 1 or (p is None and len(b) < SPLIT_THRESHOLD):
+        return horner(a, b, p)
+    powers = [b]
+    while 1 << len(powers) < len(a):
+        powers.append(multiplication.sqr(powers[-1]) if p is None else modular.mul(powers[-1], powers[-1], p))
+    return _compose(a, powers, p)
+
+
+def _compose(a, powers, p):
+    """Compose a with b, whose powers b^(2^k) are given for 2^k < len(a)"""
+    if len(a) <= HORNER_THRESHOLD:
+        return horner(a, powers[0], p)
+    k = (len(a) - 1).bit_length() - 1
+    half = 1 << k
+    return _add(_compose(a[:half], powers, p), _mul(powers[k], _compose(a[half:], powers, p), p), p)
+
+
+def compose_mod(a, b, f, p=None):
+    """Compose two dense arrays modulo a third one, with Brent and Kung's baby steps giant steps
+
+    :param f: A non constant dense array, which must be monic if p is not None
+    :param p: A prime, the arrays being reduced modulo p, or None
+    :return: The remainder of a(b) divided by f
+    :rtype: list
+    """
+    if p is None:
+        def rem(x):
+            return division.divmod_dense(x, f)[1]
+
+        def mulmod(x, y):
+            return rem(multiplication.mul(x, y))
+    else:
+        mod = modular.modulus(f, p)
+
+        def rem(x):
+            return modular.rem(x, mod, p)
+
+        def mulmod(x, y):
+            return modular.mulmod(x, y, mod, p)
+    b = rem(b)
+    m = isqrt(len(a)) + 1
+    powers = [[1]]
+    for _ in range(m):
+        powers.append(mulmod(powers[-1], b))
+    giant = powers.pop()
+    if p is None:
+        def combine(block):
+            value = []
+            for coef, power in zip(block, powers):
+                if coef:
+                    value = dense.add(value, [coef * x for x in power])
+            return value
+    else:
+        # the slots hold sums of m products of ints lower than p
+        width = (m * (p - 1) ** 2).bit_length() // 8 + 1
+        rows = [kronecker._pack(power, width) for power in powers]
+        n = len(f) - 1
+
+        def combine(block):
+            return dense.trim(modular._unpack(sum(coef * row for coef, row in zip(block, rows) if coef), n, width, p))
+    res = []
+    for start in range((len(a) - 1) // m * m, -1, -m):
+        res = _add(mulmod(res, giant), combine(a[start:start + m]), p)
+    return rem(res)
@@ -0,0 +1,264 @@
+"""Arithmetic kernels working on dense coefficient arrays.
+
+A dense array is a list in which the item at index ``i`` is the coefficient of the monomial of degree ``i``.
+The arrays returned by these functions are trimmed: they never end with a null coefficient, so the null
+polynomial is the empty list.
+"""
+from fractions import Fraction
+from math import factorial, lcm
+
+import polynomials.Monomial as Monomial
+
+
+def trim(coefs):
+    """Remove the trailing null coefficients of a dense array, in place
+
+    :param coefs: A dense array
+    :type coefs: list
+    :return: The same array, without trailing null coefficients
+    :rtype: list
+    """
+    while coefs and not coefs[-1]:
+        coefs.pop()
+    return coefs
+
+
+def add(a, b):
+    """Add two dense arrays
+
+    :rtype: list
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    res = [x + y for x, y in zip(a, b)]
+    res.extend(a[len(b):])
+    return trim(res)
+
+
+def sub(a, b):
+    """Subtract the dense array b from the dense array a
+
+    :rtype: list
+    """
+    res = [x - y for x, y in zip(a, b)]
+    if len(a) > len(b):
+        res.extend(a[len(b):])
+    else:
+        res.extend(-y for y in b[len(a):])
+    return trim(res)
+
+
+def neg(a):
+    """Negate a dense array
+
+    :rtype: list
+    """
+    return [-x for x in a]
+
+
+# Operands with at most KARATSUBA_THRESHOLD coefficients are multiplied with the schoolbook method
+KARATSUBA_THRESHOLD = 32
+
+
+def mul(a, b):
+    """Multiply two dense arrays
+
+    The product is computed with Karatsuba's divide and conquer method, falling back to the schoolbook method for
+    operands shorter than KARATSUBA_THRESHOLD.
+
+    :rtype: list
+    """
+    if not a or not b:
+        return []
+    return trim(_karatsuba(a, b))
+
+
+def _add_into(res, a, offset=0):
+    """Add the array a, shifted by offset, to the array res in place"""
+    end = offset + len(a)
+    res[offset:end] = [x + y for x, y in zip(res[offset:end], a)]
+
+
+def _sum(a, b):
+    """Add two arrays without trimming the result"""
+    if len(a) < len(b):
+        a, b = b, a
+    res = a[:]
+    _add_into(res, b)
+    return res
+
+
+def _schoolbook(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    res = [0] * (len(a) + len(b) - 1)
+    for i, y in enumerate(b):
+        if y:
+            _add_into(res, [x * y for x in a], i)
+    return res
+
+
+def _karatsuba(a, b):
+    """Multiply two non empty arrays, the product having exactly len(a) + len(b) - 1 coefficients"""
+    if len(a) < len(b):
+        a, b = b, a
+    la, lb = len(a), len(b)
+    if lb <= KARATSUBA_THRESHOLD:
+        return _schoolbook(a, b)
+    res = [0] * (la + lb - 1)
+    if 2 * lb <= la:
+        # unbalanced operands: multiply b by slices of a as long as b
+        for i in range(0, la, lb):
+            _add_into(res, _karatsuba(a[i:i + lb], b), i)
+        return res
+    m = la // 2
+    a0, a1, b0, b1 = a[:m], a[m:], b[:m], b[m:]
+    z0 = _karatsuba(a0, b0)
+    z2 = _karatsuba(a1, b1)
+    z1 = _karatsuba(_sum(a0, a1), _sum(b0, b1))
+    _add_into(z1, [-x for x in z0])
+    _add_into(z1, [-x for x in z2])
+    _add_into(res, z0)
+    _add_into(res, z1, m)
+    _add_into(res, z2, 2 * m)
+    return res
+
+
+def mul_monomial(a, coef, deg):
+    """Multiply a dense array by the monomial coef * x^deg
+
+    :rtype: list
+    """
+    if not coef:
+        return []
+    return [0] * deg + [x * coef for x in a]
+
+
+def clear_denominators(a):
+    """Scale a dense array of ints and fractions to an array of ints
+
+    :return: A tuple (coefs, den) where coefs is a dense array of ints and den the least common multiple of the
+             denominators of a, so that a == coefs / den
+    :rtype: tuple
+    """
+    den, exact_ints = 1, True
+    for x in a:
+        if type(x) is not int:
+            den, exact_ints = lcm(den, x.denominator), False
+    if exact_ints:
+        return a, 1
+    return [x * den if type(x) is int else x.numerator * (den // x.denominator) for x in a], den
+
+
+def divide_exact(a, den):
+    """Divide a dense array of ints by den, keeping the coefficients exact
+
+    :rtype: list
+    """
+    if den == 1:
+        return a
+    return [Monomial.exact(Fraction(x, den)) for x in a]
+
+
+def sqr(a):
+    """Square a dense array, using the symmetry of the products a[i] * a[j] and a[j] * a[i]
+
+    :rtype: list
+    """
+    if not a:
+        return []
+    return trim(_karatsuba_sqr(a))
+
+
+def _schoolbook_sqr(a):
+    res = [0] * (2 * len(a) - 1)
+    for i, x in enumerate(a):
+        if x:
+            res[2 * i] += x * x
+            double = 2 * x
+            _add_into(res, [double * y for y in a[i + 1:]], 2 * i + 1)
+    return res
+
+
+def _karatsuba_sqr(a):
+    """Square a non empty array, the square having exactly 2 * len(a) - 1 coefficients"""
+    if len(a) <= KARATSUBA_THRESHOLD:
+        return _schoolbook_sqr(a)
+    m = len(a) // 2
+    a0, a1 = a[:m], a[m:]
+    z0 = _karatsuba_sqr(a0)
+    z2 = _karatsuba_sqr(a1)
+    z1 = _karatsuba_sqr(_sum(a0, a1))
+    _add_into(z1, [-x for x in z0])
+    _add_into(z1, [-x for x in z2])
+    res = [0] * (2 * len(a) - 1)
+    _add_into(res, z0)
+    _add_into(res, z1, m)
+    _add_into(res, z2, 2 * m)
+    return res
+
+
+def pow_miller(a, exponent):
+    """Raise a dense array of ints to a power with J.C.P. Miller's recurrence
+
+    Each coefficient of the power is computed from the previous ones in O(len(a)), so the whole power costs
+    O(len(a) * len(a) * exponent), which is the fastest method for arrays with a few coefficients.
+
+    :param a: A dense array of ints which constant coefficient is not null
+    :type exponent: int
+    :rtype: list
+    """
+    deg = len(a) - 1
+    length = deg * exponent + 1
+    res = [a[0] ** exponent] + [0] * (length - 1)
+    for n in range(1, length):
+        total = 0
+        for j in range(1, min(n, deg) + 1):
+            total += ((exponent + 1) * j - n) * a[j] * res[n - j]
+        res[n] = total // (n * a[0])
+    return res
+
+
+def derive(a, n=1):
+    """Compute the n-th derivative of a dense array in one pass
+
+    The coefficient of degree i is multiplied by the falling factorial i (i - 1) ... (i - n + 1), which is updated
+    from one degree to the next with an exact division.
+
+    :param n: A non negative int
+    :rtype: list
+    """
+    res = []
+    falling = factorial(n)
+    for i in range(n, len(a)):
+        coef = a[i] * falling
+        res.append(coef if type(coef) is int else Monomial.exact(coef))
+        falling = falling * (i + 1) // (i + 1 - n)
+    return res
+
+
+def horner(a, val):
+    """Evaluate a dense array at an exact value with Horner's rule
+
+    For a rational value n / d, the array is evaluated with ints only: the denominators of the coefficients are
+    cleared once, each step computes acc * n + a[i] * d^(deg - i), and the result is divided by d^deg at the end,
+    so no gcd is computed during the evaluation.
+
+    :param val: An int or a Fraction
+    :return: The exact value of the polynomial
+    :rtype: int or Fraction
+    """
+    if not a:
+        return 0
+    coefs, den = clear_denominators(a)
+    num, den_val = (val, 1) if type(val) is int else (val.numerator, val.denominator)
+    acc = coefs[-1]
+    if den_val == 1:
+        for coef in reversed(coefs[:-1]):
+            acc = acc * num + coef
+        return Monomial.exact(Fraction(acc, den)) if den != 1 else acc
+    power = 1
+    for coef in reversed(coefs[:-1]):
+        power *= den_val
+        acc = acc * num + coef * power
+    return Monomial.exact(Fraction(acc, den * power))
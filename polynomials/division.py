@@ -0,0 +1,97 @@
+"""Euclidean division of dense arrays.
+
+Short divisions are computed with the schoolbook method on a dense buffer holding the remainder. When both the
+divisor and the quotient have at least NEWTON_THRESHOLD coefficients, the division is instead carried out modulo
+several primes, where the quotient is obtained from the reciprocal of the reversed divisor computed by Newton
+iteration (see polynomials.modular), so each of them costs a few multiplications instead of
+O(len(quotient) * len(divisor)) operations.
+"""
+from fractions import Fraction
+
+import polynomials.Monomial as Monomial
+import polynomials.dense as dense
+import polynomials.modular as modular
+import polynomials.multiplication as multiplication
+
+NEWTON_THRESHOLD = 64
+
+
+def div_exact(x, y):
+    """Divide two coefficients, the quotient being an int whenever it is an integer
+
+    :rtype: int or Fraction
+    """
+    if type(x) is int and type(y) is int:
+        quot, rest = divmod(x, y)
+        return quot if not rest else Fraction(x, y)
+    return Monomial.exact(Fraction(x) / y)
+
+
+def divmod_schoolbook(a, b):
+    """Divide two dense arrays with the schoolbook method
+
+    :rtype: tuple
+    """
+    rest = list(a)
+    len_b = len(b)
+    lead, low = b[-1], b[:-1]
+    quot = [0] * (len(a) - len_b + 1)
+    for i in range(len(quot) - 1, -1, -1):
+        coef = rest[i + len_b - 1]
+        if coef:
+            coef = div_exact(coef, lead)
+            quot[i] = coef
+            rest[i:i + len_b - 1] = [x - coef * y for x, y in zip(rest[i:i + len_b - 1], low)]
+    return quot, dense.trim(rest[:len_b - 1])
+
+
+def divmod_multimodular(a, b):
+    """Divide two dense arrays with Newton divisions modulo word size primes
+
+    The quotient and the remainder are computed modulo primes, combined with the chinese remainder theorem and
+    rebuilt as fractions by rational reconstruction, until the rebuilt arrays satisfy a = b * quotient + remainder.
+    Unlike a Newton division over the rationals, whose reciprocal series has huge coefficients, the cost depends on
+    the size of the quotient and of the remainder.
+
+    :rtype: tuple
+    """
+    a_int, den_a = dense.clear_denominators(a)
+    b_int, den_b = dense.clear_denominators(b)
+    len_quot, len_rest = len(a) - len(b) + 1, len(b) - 1
+    residues, modulus, count = None, 1, 0
+    for p in modular.primes():
+        if b_int[-1] % p == 0:
+            continue
+        quot, rest = modular.divmod_mod(modular.reduce(a_int, p), modular.reduce(b_int, p), p)
+        new_residues = quot + [0] * (len_quot - len(quot)) + rest + [0] * (len_rest - len(rest))
+        residues = new_residues if residues is None else modular.crt(residues, modulus, new_residues, p)
+        modulus, count = modulus * p, count + 1
+        # the reconstruction is attempted after 1, 2, 4, 8... primes
+        if count & (count - 1):
+            continue
+        rebuilt = modular.reconstruct(residues, modulus)
+        if rebuilt is None:
+            continue
+        quot, rest = dense.trim(rebuilt[:len_quot]), dense.trim(rebuilt[len_quot:])
+        if dense.add(multiplication.mul(b_int, quot), rest) == a_int:
+            # a_int = b_int * quot + rest with a = a_int / den_a and b = b_int / den_b
+            return multiplication.mul(quot, [Fraction(den_b, den_a)]), multiplication.mul(rest, [Fraction(1, den_a)])
+
+
+def divmod_dense(a, b):
+    """Divide two dense arrays
+
+    :param a: The dividend
+    :param b: The divisor, which must not be null
+    :return: A tuple (quotient, remainder) of trimmed dense arrays, such that a = b * quotient + remainder and the
+             remainder has less coefficients than b
+    :rtype: tuple
+    """
+    if not b:
+        raise ZeroDivisionError("Division by the null polynomial")
+    if len(a) < len(b):
+        return [], list(a)
+    if min(len(b), len(a) - len(b) + 1) >= NEWTON_THRESHOLD:
+        return divmod_multimodular(a, b)
+    quot, rest = divmod_schoolbook(a, b)
+    return dense.trim(quot), rest
@@ -0,0 +1,205 @@
+"""Greatest common divisors of dense arrays with rational coefficients.
+
+Euclid's algorithm over the rationals produces remainders whose coefficients grow exponentially. Short arrays are
+instead handled over the integers with the subresultant pseudo remainder sequence, which keeps the coefficients of
+the remainders as small as the determinants they are equal to. From MODULAR_THRESHOLD coefficients, the gcd is
+computed modulo several primes with the Euclid's algorithm of polynomials.modular, in the manner of Brown's
+algorithm: the images of the gcd having a degree larger than the others come from unlucky primes and are dropped,
+the others are combined with the chinese remainder theorem and rebuilt by rational reconstruction. Once the rebuilt
+gcd stays the same with one more prime, it is checked by trial divisions. Extended gcds are computed the same way,
+the result being checked with Bezout's identity.
+
+The greatest common divisors are monic, so they are unique over the rationals.
+"""
+from math import gcd as int_gcd
+
+import polynomials.dense as dense
+import polynomials.division as division
+import polynomials.modular as modular
+import polynomials.multiplication as multiplication
+
+MODULAR_THRESHOLD = 16
+
+
+def monic(a):
+    """Divide a non null dense array by its leading coefficient
+
+    :rtype: list
+    """
+    lead = a[-1]
+    return a if lead == 1 else [division.div_exact(x, lead) for x in a]
+
+
+def primitive(a):
+    """Scale a non null dense array of ints and fractions to an array of ints without common divisor
+
+    :return: The array of ints, with a positive leading coefficient
+    :rtype: list
+    """
+    a, _ = dense.clear_denominators(a)
+    content = int_gcd(*a)
+    if a[-1] < 0:
+        content = -content
+    return a if content == 1 else [x // content for x in a]
+
+
+def pseudo_remainder(a, b):
+    """Compute the remainder of lead(b)^(len(a) - len(b) + 1) * a divided by b, for arrays of ints
+
+    :rtype: list
+    """
+    rest = list(a)
+    len_b = len(b)
+    lead = b[-1]
+    exponent = len(a) - len_b + 1
+    while len(rest) >= len_b:
+        coef, shift = rest[-1], len(rest) - len_b
+        rest = [x * lead for x in rest]
+        rest[shift:] = [x - coef * y for x, y in zip(rest[shift:], b)]
+        dense.trim(rest)
+        exponent -= 1
+    return [x * lead ** exponent for x in rest] if exponent else rest
+
+
+def gcd_subresultant(a, b):
+    """Compute the gcd of two non null dense arrays of ints with the subresultant pseudo remainder sequence
+
+    :return: The primitive gcd, with a positive leading coefficient
+    :rtype: list
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    g = h = 1
+    while b:
+        delta = len(a) - len(b)
+        rest = pseudo_remainder(a, b)
+        # the remainders of the sequence are divided by g * h^delta, which divides all their coefficients
+        den = g * h ** delta
+        a, b = b, [x // den for x in rest]
+        g = a[-1]
+        h = g ** delta // h ** (delta - 1) if delta else h
+    return primitive(a)
+
+
+def gcd_modular(a, b):
+    """Compute the gcd of two non null dense arrays of ints with Brown's modular algorithm
+
+    :return: The monic gcd
+    :rtype: list
+    """
+    lead = a[-1] * b[-1]
+    residues, modulus, length, previous = None, 1, None, None
+    for p in modular.primes():
+        if lead % p == 0:
+            continue
+        image = modular.gcd(modular.reduce(a, p), modular.reduce(b, p), p)
+        if len(image) == 1:
+            return [1]
+        if length is None or len(image) < length:
+            # every previous prime was unlucky
+            residues, modulus, length, previous = image, p, len(image), None
+            continue
+        if len(image) > length:
+            continue
+        residues, modulus = modular.crt(residues, modulus, image, p), modulus * p
+        # the trial divisions are only attempted once the reconstruction is the same as with one less prime
+        rebuilt = modular.reconstruct(residues, modulus)
+        if rebuilt is None or rebuilt != previous:
+            previous = rebuilt
+            continue
+        if not division.divmod_dense(a, rebuilt)[1] and not division.divmod_dense(b, rebuilt)[1]:
+            return rebuilt
+
+
+def gcd(a, b):
+    """Compute the monic greatest common divisor of two dense arrays of ints and fractions
+
+    :return: The monic gcd, which is empty when both arrays are
+    :rtype: list
+    """
+    if not a or not b:
+        return monic(a or b) if a or b else []
+    a, b = primitive(a), primitive(b)
+    if min(len(a), len(b)) < MODULAR_THRESHOLD:
+        return monic(gcd_subresultant(a, b))
+    return gcd_modular(a, b)
+
+
+def lcm(a, b):
+    """Compute the monic least common multiple of two dense arrays of ints and fractions
+
+    :rtype: list
+    """
+    if not a or not b:
+        return []
+    quot, _ = division.divmod_dense(a, gcd(a, b))
+    return monic(multiplication.mul(quot, b))
+
+
+def xgcd_euclid(a, b):
+    """Compute the extended gcd of two non null dense arrays with Euclid's algorithm over the rationals
+
+    :rtype: tuple
+    """
+    s0, s1, t0, t1 = [1], [], [], [1]
+    while b:
+        quot, rest = division.divmod_dense(a, b)
+        a, b = b, rest
+        s0, s1 = s1, dense.sub(s0, multiplication.mul(quot, s1))
+        t0, t1 = t1, dense.sub(t0, multiplication.mul(quot, t1))
+    lead = a[-1]
+    return monic(a), [division.div_exact(x, lead) for x in s0], [division.div_exact(x, lead) for x in t0]
+
+
+def xgcd_modular(a, b):
+    """Compute the extended gcd of two non null dense arrays modulo several primes
+
+    :rtype: tuple
+    """
+    _, den_a = dense.clear_denominators(a)
+    _, den_b = dense.clear_denominators(b)
+    lead = a[-1] * b[-1] * den_a * den_b
+    residues, modulus, length, previous = None, 1, None, None
+    for p in modular.primes():
+        if lead.numerator % p == 0 or lead.denominator % p == 0:
+            continue
+        g, s, t = modular.xgcd(modular.from_rational(a, p), modular.from_rational(b, p), p)
+        if length is None or len(g) < length:
+            # every previous prime was unlucky
+            residues, modulus, length, previous = None, 1, len(g), None
+        elif len(g) > length:
+            continue
+        # s and t have less than len(b) - len(g) and len(a) - len(g) coefficients
+        len_s, len_t = len(b) - length, len(a) - length
+        image = g + s + [0] * (len_s - len(s)) + t + [0] * (len_t - len(t))
+        residues = image if residues is None else modular.crt(residues, modulus, image, p)
+        modulus *= p
+        rebuilt = modular.reconstruct(residues, modulus)
+        if rebuilt is None or rebuilt != previous:
+            previous = rebuilt
+            continue
+        g, s, t = rebuilt[:length], dense.trim(rebuilt[length:length + len_s]), dense.trim(rebuilt[length + len_s:])
+        if dense.add(multiplication.mul(s, a), multiplication.mul(t, b)) != g:
+            continue
+        # Bezout's identity proves that g is a multiple of the gcd
+        if length == 1 or not division.divmod_dense(a, g)[1] and not division.divmod_dense(b, g)[1]:
+            return g, s, t
+
+
+def xgcd(a, b):
+    """Compute the monic greatest common divisor g of two dense arrays of ints and fractions, with Bezout's
+    coefficients
+
+    :return: A tuple (g, s, t) of dense arrays such that s * a + t * b = g, where s and t have less coefficients
+             than b / g and a / g
+    :rtype: tuple
+    """
+    if not a or not b:
+        if not a and not b:
+            return [], [], []
+        lead = (a or b)[-1]
+        inverse = [division.div_exact(1, lead)]
+        return (monic(a), inverse, []) if a else (monic(b), [], inverse)
+    if min(len(a), len(b)) < MODULAR_THRESHOLD:
+        return xgcd_euclid(a, b)
+    return xgcd_modular(a, b)
@@ -0,0 +1,272 @@
+"""Factorization of dense arrays of ints into irreducible factors over the integers.
+
+The arrays are first split into square-free parts with Yun's algorithm, then each part f is factored with the
+algorithm of Zassenhaus:
+
+- f is factored modulo up to PRIMES_TRIED small primes which keep it square-free and its degree, with
+  polynomials.galois, and the prime giving the fewest factors is kept. The degrees of the factors modulo each prime
+  also give the degrees a factor of f over the integers can have, since it must be the product of some of them.
+- The factors modulo p are lifted modulo p^k with the quadratic Hensel lifting of a tree of products, p^k being
+  larger than twice a bound on the coefficients of the factors of f.
+- The lifted factors are recombined by increasing subset sizes. A subset is only tried when the sum of its degrees
+  is a possible degree and its constant coefficient divides the one of f, before the trial division.
+"""
+from itertools import combinations
+from math import gcd as int_gcd, isqrt
+
+import polynomials.dense as dense
+import polynomials.division as division
+import polynomials.euclid as euclid
+import polynomials.galois as galois
+import polynomials.modular as modular
+import polynomials.ntt as ntt
+
+PRIMES_TRIED = 5
+
+
+def derivative(a):
+    """Compute the derivative of a dense array
+
+    :rtype: list
+    """
+    return [i * coef for i, coef in enumerate(a)][1:]
+
+
+def squarefree(a):
+    """Compute the square-free factorization of a primitive dense array of ints with Yun's algorithm
+
+    With g = gcd(a, a'), b = a / g is the product of the square-free factors of a and c = a' / g - b' is
+    divisible by those of multiplicity larger than 1, so gcd(b, c) is the factor of multiplicity 1 and the others
+    are found the same way, each step dividing b and c by the factor found. The gcds are made primitive, so that
+    by Gauss's lemma every division is an exact division of arrays of ints.
+
+    :param a: A non constant primitive dense array of ints
+    :return: A list of tuples (factor, multiplicity) of primitive arrays of ints with a positive leading
+             coefficient, coprime with each other, sorted by multiplicity
+    :rtype: list
+    """
+    diff = derivative(a)
+    g = euclid.primitive(euclid.gcd(a, diff))
+    b = exact_quotient(a, g)
+    c = exact_quotient(diff, g)
+    res, multiplicity = [], 1
+    while len(b) > 1:
+        c = dense.sub(c, derivative(b))
+        y = euclid.primitive(euclid.gcd(b, c))
+        if len(y) > 1:
+            res.append((y, multiplicity))
+            b = exact_quotient(b, y)
+            c = exact_quotient(c, y)
+        multiplicity += 1
+    return res
+
+
+def squarefree_decomposition(a):
+    """Compute the content and the square-free factorization of a dense array of ints and fractions
+
+    :param a: A non null dense array
+    :return: A tuple (content, factors) where content is an int or a Fraction and factors the list returned by
+             squarefree for a divided by content, empty if a is constant
+    :rtype: tuple
+    """
+    ints, den = dense.clear_denominators(a)
+    content = int_gcd(*ints)
+    if ints[-1] < 0:
+        content = -content
+    factors = squarefree([x // content for x in ints]) if len(a) > 1 else []
+    return division.div_exact(content, den), factors
+
+
+def _symmetric(a, modulus):
+    """Map the ints of a dense array modulo modulus to the interval (-modulus / 2, modulus / 2]"""
+    half = modulus // 2
+    return [x - modulus if x > half else x for x in a]
+
+
+def exact_quotient(a, b):
+    """Divide two dense arrays of ints when the quotient is an array of ints
+
+    The division stops as soon as a coefficient of the quotient is not an int, which is the common case when b
+    does not divide a.
+
+    :return: The quotient, or None if it is not an array of ints or if the remainder is not null
+    :rtype: list
+    """
+    rest = list(a)
+    len_b = len(b)
+    lead, low = b[-1], b[:-1]
+    quot = [0] * (len(a) - len_b + 1)
+    for i in range(len(quot) - 1, -1, -1):
+        coef, remainder = divmod(rest[i + len_b - 1], lead)
+        if remainder:
+            return None
+        if coef:
+            quot[i] = coef
+            rest[i:i + len_b - 1] = [x - coef * y for x, y in zip(rest[i:i + len_b - 1], low)]
+    return quot if not any(rest[:len_b - 1]) else None
+
+
+def hensel_step(f, g, h, s, t, modulus):
+    """Lift a factorization f = g * h modulo m to a factorization modulo modulus, which must divide m^2
+
+    :param g: A dense array whose leading coefficient is the one of f modulo m
+    :param h: A monic dense array
+    :param s: A dense array such that s * g + t * h = 1 modulo m
+    :param t: A dense array such that s * g + t * h = 1 modulo m
+    :return: The tuple (g, h, s, t) lifted modulo modulus
+    :rtype: tuple
+    """
+    e = modular.sub(modular.reduce(f, modulus), modular.mul(g, h, modulus), modulus)
+    quot, rest = modular.divmod_mod(modular.mul(s, e, modulus), h, modulus)
+    g = modular.add(g, modular.add(modular.mul(t, e, modulus), modular.mul(quot, g, modulus), modulus), modulus)
+    h = modular.add(h, rest, modulus)
+    b = modular.sub(modular.add(modular.mul(s, g, modulus), modular.mul(t, h, modulus), modulus), [1], modulus)
+    c, d = modular.divmod_mod(modular.mul(s, b, modulus), h, modulus)
+    s = modular.sub(s, d, modulus)
+    t = modular.sub(t, modular.add(modular.mul(t, b, modulus), modular.mul(c, g, modulus), modulus), modulus)
+    return g, h, s, t
+
+
+def hensel_lift(f, factors, p, k):
+    """Lift the factorization of f modulo p into monic factors modulo p^k
+
+    The factors are split in two halves, whose products g and h are lifted together with quadratic Hensel steps,
+    then each half is lifted the same way from g and h.
+
+    :param f: A dense array of ints whose leading coefficient is not divisible by p
+    :param factors: The monic factors of f modulo p, coprime with each other
+    :return: The list of the monic factors of f modulo p^k, in the same order
+    :rtype: list
+    """
+    modulus = p ** k
+    if len(factors) == 1:
+        return [modular.scale(modular.reduce(f, modulus), pow(f[-1], -1, modulus), modulus)]
+    half = len(factors) // 2
+    g = [f[-1] % p]
+    for factor in factors[:half]:
+        g = modular.mul(g, factor, p)
+    h = [1]
+    for factor in factors[half:]:
+        h = modular.mul(h, factor, p)
+    _, s, t = modular.xgcd(g, h, p)
+    exponent = 1
+    while exponent < k:
+        exponent = min(2 * exponent, k)
+        g, h, s, t = hensel_step(f, g, h, s, t, p ** exponent)
+    return hensel_lift(g, factors[:half], p, k) + hensel_lift(h, factors[half:], p, k)
+
+
+def _degree_sums(degrees):
+    """The set of the sums of the subsets of degrees, as the bits of an int"""
+    sums = 1
+    for degree in degrees:
+        sums |= sums << degree
+    return sums
+
+
+def _choose_prime(f):
+    """Factor f modulo the first primes which keep it square-free
+
+    :return: A tuple (p, factors, degrees) where factors are the monic factors of f modulo p, the prime giving the
+             fewest factors, and the bits of degrees are the possible degrees of the factors of f
+    :rtype: tuple
+    """
+    best, degrees, tried, p = None, (1 << len(f)) - 1, 0, 2
+    while tried < PRIMES_TRIED:
+        p += 1
+        if not ntt._is_prime(p) or f[-1] % p == 0:
+            continue
+        image = modular.reduce(f, p)
+        if len(modular.gcd(image, galois.derivative(image, p), p)) > 1:
+            continue
+        tried += 1
+        _, factors = galois.factor(image, p)
+        factors = [factor for factor, _ in factors]
+        degrees &= _degree_sums(len(factor) - 1 for factor in factors)
+        if best is None or len(factors) < len(best[1]):
+            best = p, factors
+        # the only possible degrees are 0 and deg(f), so f is irreducible
+        if degrees == 1 | 1 << (len(f) - 1):
+            break
+    return best[0], best[1], degrees
+
+
+def recombine(f, lifted, modulus, degrees):
+    """Find the factors of f over the integers among the products of its lifted factors
+
+    :param f: A primitive square-free dense array of ints, with a non null constant coefficient
+    :param lifted: The monic factors of f modulo modulus, which is larger than twice the coefficients of the
+                   factors of f times its leading coefficient
+    :param degrees: The possible degrees of the factors of f, as the bits of an int
+    :return: The list of the primitive irreducible factors of f
+    :rtype: list
+    """
+    res = []
+    remaining = list(range(len(lifted)))
+    size = 1
+    while 2 * size <= len(remaining):
+        lead = f[-1]
+        for subset in combinations(remaining, size):
+            if not degrees >> sum(len(lifted[i]) - 1 for i in subset) & 1:
+                continue
+            # the constant coefficient of a factor of f divides the constant coefficient of f
+            constant = lead
+            for i in subset:
+                constant = constant * lifted[i][0] % modulus
+            constant = _symmetric([constant], modulus)[0]
+            if not constant or (lead * f[0]) % constant:
+                continue
+            candidate = [lead % modulus]
+            for i in subset:
+                candidate = modular.mul(candidate, lifted[i], modulus)
+            candidate = euclid.primitive(_symmetric(candidate, modulus))
+            quot = exact_quotient(f, candidate)
+            if quot is not None:
+                res.append(candidate)
+                f = quot
+                remaining = [i for i in remaining if i not in subset]
+                break
+        else:
+            size += 1
+    res.append(f)
+    return res
+
+
+def factor_squarefree(f):
+    """Factor a primitive square-free dense array of ints into irreducible factors
+
+    :param f: A primitive square-free dense array of ints, with a positive leading coefficient
+    :return: The list of its primitive irreducible factors
+    :rtype: list
+    """
+    if len(f) <= 2:
+        return [f]
+    if not f[0]:
+        return [[0, 1]] + factor_squarefree(f[1:])
+    p, factors, degrees = _choose_prime(f)
+    if len(factors) == 1 or degrees == 1 | 1 << (len(f) - 1):
+        return [f]
+    # Mignotte's bound on the coefficients of the factors of f, times its leading coefficient
+    bound = abs(f[-1]) * (isqrt(sum(x * x for x in f)) + 1) << (len(f) - 1)
+    k = 1
+    while p ** k <= 2 * bound:
+        k += 1
+    return recombine(f, hensel_lift(f, factors, p, k), p ** k, degrees)
+
+
+def factor(a):
+    """Factor a dense array of ints and fractions into irreducible factors over the integers
+
+    :param a: A non null dense array
+    :return: A tuple (content, factors) where content is an int or a Fraction and factors a list of tuples
+             (factor, multiplicity) of primitive irreducible arrays of ints with a positive leading coefficient,
+             sorted by degree then coefficients, such that a is content times the product of the factors raised to
+             their multiplicity
+    :rtype: tuple
+    """
+    content, parts = squarefree_decomposition(a)
+    res = []
+    for part, multiplicity in parts:
+        res.extend((factor, multiplicity) for factor in factor_squarefree(part))
+    res.sort(key=lambda item: (len(item[0]), item[0][::-1]))
+    return content, res
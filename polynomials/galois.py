@@ -0,0 +1,252 @@
+"""Factorization of dense arrays modulo a prime.
+
+The arrays are first split into square-free parts with their multiplicities. Each part is then factored in two
+stages: the distinct degree factorization gathers the irreducible factors of each degree d as gcd(f, x^(p^d) - x),
+and the equal degree factorization splits the products of factors of the same degree, with the probabilistic
+algorithm of Cantor and Zassenhaus, or with Berlekamp's algorithm for primes lower than BERLEKAMP_THRESHOLD, whose
+splitting tries every element of the field.
+
+Both stages apply the Frobenius map a -> a^p modulo f many times. It is the linear map which sends x^i to
+x^(p * i) mod f, so the arrays x^(p * i) mod f are computed once and packed like the slots of a Kronecker
+substitution (see polynomials.kronecker): the image of a is then a sum of small multiples of big ints, which costs
+about as much as one product modulo f instead of the log2(p) squares of a modular power. The gcds with x^(p^d) - x
+are only computed once the product of DDF_BATCH of them has been accumulated.
+"""
+import random
+
+import polynomials.dense as dense
+import polynomials.kronecker as kronecker
+import polynomials.modular as modular
+
+BERLEKAMP_THRESHOLD = 16
+DDF_BATCH = 64
+
+# The random arrays of the Cantor-Zassenhaus algorithm are drawn from a generator with a fixed seed, so the
+# factorizations are reproducible
+_random = random.Random(0)
+
+
+def derivative(a, p):
+    """Compute the derivative of a dense array modulo p
+
+    :rtype: list
+    """
+    return modular.reduce([i * coef for i, coef in enumerate(a)][1:], p)
+
+
+def squarefree(a, p):
+    """Compute the square-free factorization of a monic dense array modulo p
+
+    Repeated gcds with the derivative give the factors of each multiplicity lower than p. What remains is a
+    polynomial in x^p, which is the p-th power of the polynomial with the same coefficients in x, since a^p = a for
+    every element of the field, and it is factored recursively.
+
+    :return: A list of tuples (factor, multiplicity) of monic square-free arrays, coprime with each other, whose
+             product raised to the multiplicities is a
+    :rtype: list
+    """
+    res = []
+    diff = derivative(a, p)
+    if diff:
+        c = modular.gcd(a, diff, p)
+        w = modular.divmod_mod(a, c, p)[0]
+        i = 1
+        while len(w) > 1:
+            y = modular.gcd(w, c, p)
+            z = modular.divmod_mod(w, y, p)[0]
+            if len(z) > 1:
+                res.append((z, i))
+            w, c, i = y, modular.divmod_mod(c, y, p)[0], i + 1
+    else:
+        c = a
+    if len(c) > 1:
+        res.extend((factor, multiplicity * p) for factor, multiplicity in squarefree(c[::p], p))
+    return res
+
+
+def frobenius(mod, p):
+    """Compute the packed arrays x^(p * i) mod f, for i lower than deg(f)
+
+    :param mod: The modulus of f, precomputed by polynomials.modular.modulus
+    :return: A tuple (rows, width) where rows is the list of the arrays packed on slots of width bytes
+    :rtype: tuple
+    """
+    f, width = mod[0], mod[1]
+    h = modular.powmod([0, 1], p, mod, p)
+    powers = [[1], h]
+    # squares are cheaper than products, so x^(2pi) mod f is computed as (x^(pi) mod f)^2
+    for i in range(2, len(f) - 1):
+        half = powers[i // 2]
+        powers.append(modular.mulmod(half, half, mod, p) if i % 2 == 0 else modular.mulmod(powers[-1], h, mod, p))
+    return [kronecker._pack(power, width) for power in powers[:len(f) - 1]], width
+
+
+def apply_frobenius(a, frob, p):
+    """Compute a^p mod f from the packed arrays of frobenius
+
+    :param a: A dense array of less than deg(f) coefficients
+    :param frob: The tuple returned by frobenius for f
+    :rtype: list
+    """
+    rows, width = frob
+    value = sum(coef * rows[i] for i, coef in enumerate(a) if coef)
+    return dense.trim(modular._unpack(value, len(rows), width, p))
+
+
+def distinct_degree(f, p, frob=None):
+    """Split a monic square-free dense array into the products of its irreducible factors of each degree
+
+    :param frob: The tuple returned by frobenius for f, or for a multiple of f
+    :return: A list of tuples (g, d), where g is the product of the irreducible factors of f of degree d
+    :rtype: list
+    """
+    mod = modular.modulus(f, p)
+    if frob is None:
+        frob = frobenius(mod, p)
+    res, rest = [], f
+    power, d = [0, 1], 0
+    batch, acc = [], [1]
+    while 2 * (d + 1) < len(rest):
+        d += 1
+        power = modular.rem(apply_frobenius(power, frob, p), mod, p)
+        batch.append(power)
+        acc = modular.mulmod(acc, modular.sub(power, [0, 1], p), mod, p)
+        if len(batch) < DDF_BATCH and 2 * (d + 1) < len(rest):
+            continue
+        found = modular.gcd(rest, acc, p)
+        if len(found) > 1:
+            # the factors found are split by degree with gcds on their product, which is usually short
+            found_mod = modular.modulus(found, p)
+            for degree, power_d in enumerate(batch, d - len(batch) + 1):
+                g = modular.gcd(found, modular.sub(modular.rem(power_d, found_mod, p), [0, 1], p), p)
+                if len(g) > 1:
+                    res.append((g, degree))
+                    found = modular.divmod_mod(found, g, p)[0]
+                    rest = modular.divmod_mod(rest, g, p)[0]
+                    if len(found) == 1:
+                        break
+                    found_mod = modular.modulus(found, p)
+            # the next steps work modulo the factors left, whose degree is lower
+            if len(rest) > 1:
+                mod = modular.modulus(rest, p)
+                power = modular.rem(power, mod, p)
+        batch, acc = [], [1]
+    if len(rest) > 1:
+        res.append((rest, len(rest) - 1))
+    return res
+
+
+def cantor_zassenhaus(f, d, p, frob):
+    """Split a monic product of irreducible factors of degree d modulo an odd prime with Cantor-Zassenhaus' algorithm
+
+    For a random array a, a^((p^d - 1) / 2) is 1 or -1 modulo each factor, so its gcd with f minus 1 is a
+    product of about half the factors. The power is the norm a^(1 + p + ... + p^(d - 1)), computed with the
+    Frobenius map, raised to the power (p - 1) / 2.
+
+    :param frob: The tuple returned by frobenius for a multiple of f
+    :return: The list of the irreducible factors of f
+    :rtype: list
+    """
+    if len(f) - 1 == d:
+        return [f]
+    mod = modular.modulus(f, p)
+    while True:
+        a = dense.trim([_random.randrange(p) for _ in range(len(f) - 1)])
+        if len(a) < 2:
+            continue
+        norm = power = a
+        for _ in range(d - 1):
+            power = modular.rem(apply_frobenius(power, frob, p), mod, p)
+            norm = modular.mulmod(norm, power, mod, p)
+        g = modular.gcd(f, modular.sub(modular.powmod(norm, (p - 1) // 2, mod, p), [1], p), p)
+        if 1 < len(g) < len(f):
+            return cantor_zassenhaus(g, d, p, frob) + cantor_zassenhaus(modular.divmod_mod(f, g, p)[0], d, p, frob)
+
+
+def berlekamp(f, d, p):
+    """Split a monic square-free dense array into its irreducible factors with Berlekamp's algorithm
+
+    The arrays v of degree lower than deg(f) such that v^p = v mod f form a subspace of dimension the number of
+    irreducible factors of f, in which each v is constant modulo every factor: for each factor g of f already
+    found, the gcds of g and v - s for s in the field split g unless v is constant modulo g. The subspace is the
+    left kernel of the matrix of the Frobenius map minus the identity, computed by Gaussian elimination on rows
+    packed in big ints, with the identity packed above the matrix.
+
+    :param d: The degree of the irreducible factors of f if they all have the same degree, or 1
+    :return: The list of the irreducible factors of f
+    :rtype: list
+    """
+    n = len(f) - 1
+    if n == d:
+        return [f]
+    mod = modular.modulus(f, p)
+    h = modular.powmod([0, 1], p, mod, p)
+    # the slots hold the sum of n products of entries lower than p, and an entry lower than p
+    width = (n * (p - 1) ** 2 + p).bit_length() // 8 + 1
+    shift, mask = 8 * width, (1 << (8 * width)) - 1
+    rows, power = [], [1]
+    for i in range(n):
+        row = power + [0] * (2 * n - len(power))
+        row[i] = (row[i] - 1) % p
+        row[n + i] = 1
+        rows.append(kronecker._pack(row, width))
+        power = modular.mulmod(power, h, mod, p)
+    for column in range(n):
+        # the slot 0 of the rows holds their entry in the current column
+        pivot = next((i for i, row in enumerate(rows) if (row & mask) % p), None)
+        if pivot is None:
+            rows = [row >> shift for row in rows]
+            continue
+        row = rows.pop(pivot)
+        inv = pow(-(row & mask), -1, p)
+        # the pivot row is scaled to hold -1 in its slot 0, so adding it c times to a row cancels its entry c
+        pivot_row = kronecker._pack([x * inv % p for x in modular._unpack(row, 2 * n - column, width, p)], width)
+        rows = [(row + (row & mask) % p * pivot_row) >> shift for row in rows]
+    kernel = [dense.trim(modular._unpack(row, n, width, p)) for row in rows]
+    factors = [f]
+    for v in kernel:
+        if len(v) < 2:
+            continue
+        split = []
+        for g in factors:
+            if len(g) - 1 == d:
+                split.append(g)
+                continue
+            for s in range(p):
+                part = modular.gcd(g, modular.sub(v, [s], p), p)
+                if 1 < len(part) < len(g):
+                    split.append(part)
+                    g = modular.divmod_mod(g, part, p)[0]
+                    if len(g) - 1 == d:
+                        break
+            split.append(g)
+        factors = split
+        if len(factors) == len(kernel):
+            break
+    return factors
+
+
+def factor(a, p):
+    """Factor a dense array modulo a prime into irreducible factors
+
+    :param a: A non null dense array, reduced modulo p
+    :return: A tuple (lead, factors) where lead is the leading coefficient of a and factors a list of tuples
+             (factor, multiplicity) of monic irreducible arrays, sorted by degree then coefficients, such that a is
+             lead times the product of the factors raised to their multiplicity
+    :rtype: tuple
+    """
+    lead = a[-1]
+    res = []
+    for part, multiplicity in squarefree(modular.monic(a, p), p):
+        if len(part) == 2:
+            res.append((part, multiplicity))
+            continue
+        frob = frobenius(modular.modulus(part, p), p)
+        for g, d in distinct_degree(part, p, frob):
+            if p < BERLEKAMP_THRESHOLD or p == 2:
+                factors = berlekamp(g, d, p)
+            else:
+                factors = cantor_zassenhaus(g, d, p, frob)
+            res.extend((factor, multiplicity) for factor in factors)
+    res.sort(key=lambda item: (len(item[0]), item[0][::-1]))
+    return lead, res
@@ -0,0 +1,95 @@
+"""Interpolation of exact data by a polynomial.
+
+A few points are interpolated with Newton's divided differences, which costs O(n^2) operations on the exact data.
+From TREE_THRESHOLD points, the interpolant is instead computed modulo several primes with subproduct trees (see
+polynomials.SubproductTree), combined with the chinese remainder theorem and rebuilt as fractions by rational
+reconstruction, so the cost depends on the size of the coefficients of the interpolant rather than on the size of
+the intermediate divided differences. This is much faster for values sampled from a polynomial with small
+coefficients, but interpolating arbitrary values gives coefficients of about 40 bits per point: after
+len(points) // PRIMES_RATIO primes, the divided differences are used instead.
+"""
+import polynomials.Monomial as Monomial
+import polynomials.SubproductTree as SubproductTree
+import polynomials.dense as dense
+import polynomials.division as division
+import polynomials.modular as modular
+
+TREE_THRESHOLD = 48
+# The multimodular interpolation gives up after len(points) // PRIMES_RATIO primes
+PRIMES_RATIO = 8
+
+
+def newton(points, values):
+    """Interpolate exact values with Newton's divided differences
+
+    :rtype: list
+    """
+    coefs = list(values)
+    n = len(points)
+    for j in range(1, n):
+        for i in range(n - 1, j - 1, -1):
+            coefs[i] = division.div_exact(coefs[i] - coefs[i - 1], points[i] - points[i - j])
+    # Horner's rule on the Newton form coefs[0] + (x - points[0]) * (coefs[1] + (x - points[1]) * (...))
+    res = [coefs[-1]]
+    for i in range(n - 2, -1, -1):
+        point = points[i]
+        res = [coefs[i] - point * res[0]] + [x - point * y for x, y in zip(res, res[1:])] + [res[-1]]
+    return dense.trim(res)
+
+
+def interpolate_multimodular(points, values, max_primes=None):
+    """Interpolate exact values with subproduct trees modulo word size primes
+
+    After 1, 2, 4, 8... primes, the interpolant is rebuilt by rational reconstruction and accepted once it agrees
+    with the interpolant modulo the next prime.
+
+    :param max_primes: If given, at most this number of primes are used
+    :type max_primes: int
+    :return: The trimmed dense array of the interpolant, or None if max_primes primes were not enough to rebuild it
+    :rtype: list
+    """
+    dens = 1
+    for x in points + values:
+        if type(x) is not int:
+            dens *= x.denominator
+    residues, modulus, count, rebuilt = None, 1, 0, None
+    for p in modular.primes():
+        if dens % p == 0 or len({modular.reduce_coef(x, p) for x in points}) < len(points):
+            continue
+        interpolant = SubproductTree.SubproductTree(points, p).interpolate(values)
+        if rebuilt is not None:
+            if modular.from_rational(rebuilt, p) == interpolant:
+                return rebuilt
+            rebuilt = None
+        if count == max_primes:
+            return None
+        interpolant = interpolant + [0] * (len(points) - len(interpolant))
+        residues = interpolant if residues is None else modular.crt(residues, modulus, interpolant, p)
+        modulus, count = modulus * p, count + 1
+        # the reconstruction is attempted after 1, 2, 4, 8... primes
+        if count & (count - 1):
+            continue
+        rebuilt = modular.reconstruct(residues, modulus)
+        rebuilt = rebuilt and dense.trim(rebuilt)
+
+
+def interpolate(points, values):
+    """Compute the polynomial of degree lower than len(points) taking the given values at the given points
+
+    :param points: Distinct points, in any numeric format
+    :param values: The values at each point, in any numeric format
+    :return: The trimmed dense array of the interpolant
+    :rtype: list
+    """
+    points = [Monomial.exact(x) for x in points]
+    values = [Monomial.exact(y) for y in values]
+    if len(points) != len(values):
+        raise ValueError(f"There are {len(points)} points but {len(values)} values")
+    if len(set(points)) < len(points):
+        raise ValueError("The interpolation points must be distinct")
+    if not points:
+        return []
+    if len(points) < TREE_THRESHOLD:
+        return newton(points, values)
+    res = interpolate_multimodular(points, values, len(points) // PRIMES_RATIO)
+    return newton(points, values) if res is None else res
@@ -0,0 +1,63 @@
+"""Multiplication of integer dense arrays by Kronecker substitution.
+
+Each array is packed into a single big integer by evaluating it at x = 2^k, where k is a number of bits large
+enough to hold any coefficient of the product with its sign. The two integers are multiplied once, which lets
+CPython's own big integer multiplication do the work, and the coefficients of the product are read back from the
+slots of k bits of the result.
+"""
+import polynomials.dense as dense
+
+
+def _pack(a, width):
+    """Evaluate the array of non negative ints a at 2^(8 * width)"""
+    return int.from_bytes(b"".join(x.to_bytes(width, "little") for x in a), "little")
+
+
+def pack(a, width):
+    """Evaluate the dense array of ints a at x = 2^(8 * width)
+
+    :param width: The size of a slot, in bytes, which must be large enough to hold the absolute value of any item
+    :rtype: int
+    """
+    positive = _pack([x if x > 0 else 0 for x in a], width)
+    negative = _pack([-x if x < 0 else 0 for x in a], width)
+    return positive - negative
+
+
+def unpack(value, length, width):
+    """Read the signed coefficients of a product packed by slots of width bytes
+
+    :param value: The packed value, which must be the evaluation at 2^(8 * width) of an array of length coefficients
+                  lower than 2^(8 * width - 1) in absolute value
+    :rtype: list
+    """
+    half = 1 << (8 * width - 1)
+    value += _pack([half] * length, width)
+    data = value.to_bytes(length * width, "little")
+    return [int.from_bytes(data[i:i + width], "little") - half for i in range(0, length * width, width)]
+
+
+def mul(a, b):
+    """Multiply two dense arrays of ints
+
+    :rtype: list
+    """
+    if not a or not b:
+        return []
+    bound = min(len(a), len(b)) * max(map(abs, a)) * max(map(abs, b))
+    width = (bound.bit_length() + 1) // 8 + 1
+    length = len(a) + len(b) - 1
+    return dense.trim(unpack(pack(a, width) * pack(b, width), length, width))
+
+
+def sqr(a):
+    """Square a dense array of ints, packing it once
+
+    :rtype: list
+    """
+    if not a:
+        return []
+    bound = len(a) * max(map(abs, a)) ** 2
+    width = (bound.bit_length() + 1) // 8 + 1
+    value = pack(a, width)
+    return dense.trim(unpack(value * value, 2 * len(a) - 1, width))
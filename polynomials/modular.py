@@ -0,0 +1,393 @@
+"""Arithmetic kernels working on dense arrays of ints modulo a prime.
+
+The arrays handled by these functions hold ints between 0 and p - 1 and are trimmed, like the arrays of
+polynomials.dense. Products are computed with the kernels of polynomials.multiplication, so long ones cost a
+single big integer multiplication, and long divisions use the Newton reciprocal of the reversed divisor.
+"""
+from fractions import Fraction
+from math import isqrt
+
+import polynomials.dense as dense
+import polynomials.kronecker as kronecker
+import polynomials.multiplication as multiplication
+import polynomials.ntt as ntt
+
+NEWTON_THRESHOLD = 64
+# Greatest common divisors of arrays of at least HGCD_THRESHOLD coefficients are computed with half gcds, which
+# handle operands shorter than HGCD_BASE_THRESHOLD with Euclid's algorithm
+HGCD_THRESHOLD = 256
+HGCD_BASE_THRESHOLD = 64
+
+
+def primes(bits=62):
+    """Yield the primes lower than 2^bits, from the largest one
+
+    :rtype: iterator
+    """
+    n = (1 << bits) - 1
+    while n > 2:
+        if ntt._is_prime(n):
+            yield n
+        n -= 2
+
+
+def reduce(a, p):
+    """Reduce a dense array of ints modulo p
+
+    :rtype: list
+    """
+    return dense.trim([x % p for x in a])
+
+
+def reduce_coef(x, p):
+    """Reduce an int or a fraction modulo p, which must not divide its denominator
+
+    :rtype: int
+    """
+    return x % p if type(x) is int else x.numerator * pow(x.denominator, -1, p) % p
+
+
+def from_rational(a, p):
+    """Reduce a dense array of ints and fractions modulo p, which must not divide any denominator
+
+    :rtype: list
+    """
+    return dense.trim([reduce_coef(x, p) for x in a])
+
+
+def add(a, b, p):
+    return reduce(dense.add(a, b), p)
+
+
+def sub(a, b, p):
+    return reduce(dense.sub(a, b), p)
+
+
+def scale(a, c, p):
+    """Multiply a dense array by the constant c modulo p
+
+    :rtype: list
+    """
+    return reduce([x * c for x in a], p)
+
+
+def mul(a, b, p):
+    """Multiply two dense arrays modulo p
+
+    :rtype: list
+    """
+    return reduce(multiplication.mul(a, b), p)
+
+
+def monic(a, p):
+    """Divide a non null dense array by its leading coefficient modulo p
+
+    :rtype: list
+    """
+    return scale(a, pow(a[-1], -1, p), p)
+
+
+def reciprocal(f, length, p):
+    """Compute the inverse of a power series modulo p with Newton iteration
+
+    :param f: A dense array which constant coefficient is invertible modulo p
+    :param length: The number of coefficients to compute
+    :return: The array g of length coefficients such that f * g = 1 modulo x^length and p, which may be shorter
+             when its last coefficients are null
+    :rtype: list
+    """
+    g = [pow(f[0], -1, p)]
+    known = 1
+    while known < length:
+        known = min(2 * known, length)
+        # g <- g * (2 - f * g), which doubles the number of correct coefficients
+        error = mul(f[:known], g, p)[:known]
+        error = [-x % p for x in error] + [0] * (known - len(error))
+        error[0] = (error[0] + 2) % p
+        g = mul(g, error, p)[:known]
+    return dense.trim(g)
+
+
+def divmod_schoolbook(a, b, p):
+    rest = list(a)
+    len_b = len(b)
+    inv, low = pow(b[-1], -1, p), b[:-1]
+    quot = [0] * (len(a) - len_b + 1)
+    for i in range(len(quot) - 1, -1, -1):
+        coef = rest[i + len_b - 1] * inv % p
+        if coef:
+            quot[i] = coef
+            rest[i:i + len_b - 1] = [(x - coef * y) % p for x, y in zip(rest[i:i + len_b - 1], low)]
+    return dense.trim(quot), dense.trim(rest[:len_b - 1])
+
+
+def divmod_newton(a, b, p):
+    length = len(a) - len(b) + 1
+    rev_quot = mul(a[::-1][:length], reciprocal(b[::-1], length, p), p)[:length]
+    quot = dense.trim((rev_quot + [0] * (length - len(rev_quot)))[::-1])
+    return quot, sub(a, mul(b, quot, p), p)
+
+
+def divmod_mod(a, b, p):
+    """Divide two dense arrays modulo p
+
+    :param b: A non null dense array, reduced modulo p
+    :return: A tuple (quotient, remainder) of dense arrays modulo p
+    :rtype: tuple
+    """
+    if not b:
+        raise ZeroDivisionError("Division by the null polynomial")
+    if len(a) < len(b):
+        return [], list(a)
+    if min(len(b), len(a) - len(b) + 1) >= NEWTON_THRESHOLD:
+        return divmod_newton(a, b, p)
+    return divmod_schoolbook(a, b, p)
+
+
+def modulus(f, p):
+    """Precompute the reduction modulo a monic dense array f, for rem, mulmod and powmod
+
+    The products modulo f are computed with Kronecker substitution on slots wide enough for any product of two
+    arrays reduced modulo f, and the remainders with the Newton reciprocal of the reversed f, which is packed once.
+
+    :param f: A monic dense array with at least 2 coefficients, reduced modulo p
+    :return: A tuple (f, width, inverse, low) where width is the size of the slots in bytes, inverse the packed
+             reciprocal of the reversed f and low the packed coefficients of f but the leading one
+    :rtype: tuple
+    """
+    n = len(f) - 1
+    width = (n * (p - 1) ** 2).bit_length() // 8 + 1
+    inverse = reciprocal(f[::-1], n - 1, p) if n > 1 else []
+    return f, width, kronecker._pack(inverse, width), kronecker._pack(f[:-1], width)
+
+
+def _unpack(value, length, width, p):
+    """Read length slots of width bytes from a non negative packed value, modulo p"""
+    data = (value & ((1 << (8 * width * length)) - 1)).to_bytes(length * width, "little")
+    return [int.from_bytes(data[i:i + width], "little") % p for i in range(0, length * width, width)]
+
+
+def rem(a, mod, p):
+    """Compute the remainder of a dense array modulo the array of a precomputed modulus
+
+    :param a: A dense array of ints between 0 and p - 1
+    :param mod: A modulus precomputed by modulus(f, p)
+    :rtype: list
+    """
+    f, width, inverse, low = mod
+    n = len(f) - 1
+    if n == 1:
+        root, acc = -f[0] % p, 0
+        for coef in reversed(a):
+            acc = (acc * root + coef) % p
+        return [acc] if acc else []
+    a = list(a)
+    while len(a) > n:
+        # the 2n - 1 highest coefficients are reduced at once, their quotient q having length <= n - 1 coefficients
+        start = max(len(a) - 2 * n + 1, 0)
+        top = a[start:]
+        length = len(top) - n
+        quot = _unpack(kronecker._pack(top[:n - 1:-1], width) * inverse, length, width, p)[::-1]
+        # f = low + x^n, so the low n coefficients of quot * f are those of quot * low
+        prod = _unpack(kronecker._pack(quot, width) * low, n, width, p)
+        a[start:] = [(x - y) % p for x, y in zip(top, prod)]
+    return dense.trim(a)
+
+
+def mulmod(a, b, mod, p):
+    """Multiply two dense arrays reduced modulo the array of a precomputed modulus
+
+    :param mod: A modulus precomputed by modulus(f, p)
+    :rtype: list
+    """
+    if not a or not b:
+        return []
+    width = mod[1]
+    value = kronecker._pack(a, width)
+    value = value * value if a is b else value * kronecker._pack(b, width)
+    return rem(_unpack(value, len(a) + len(b) - 1, width, p), mod, p)
+
+
+def powmod(a, exponent, mod, p):
+    """Raise a dense array to a non negative power modulo the array of a precomputed modulus
+
+    :param mod: A modulus precomputed by modulus(f, p)
+    :rtype: list
+    """
+    if exponent < 0:
+        raise ValueError("A polynomial can only be raised to a non negative integer power")
+    a = rem(a, mod, p)
+    res = [1]
+    for bit in bin(exponent)[2:]:
+        res = mulmod(res, res, mod, p)
+        if bit == "1":
+            res = mulmod(res, a, mod, p)
+    return rem(res, mod, p)
+
+
+def _euclid_step(matrix, quot, p):
+    """Multiply the matrix of a step of Euclid's algorithm, ((0, 1), (1, -quot)), by matrix"""
+    m00, m01, m10, m11 = matrix
+    return m10, m11, sub(m00, mul(quot, m10, p), p), sub(m01, mul(quot, m11, p), p)
+
+
+def _apply(matrix, a, b, p):
+    m00, m01, m10, m11 = matrix
+    return add(mul(m00, a, p), mul(m01, b, p), p), add(mul(m10, a, p), mul(m11, b, p), p)
+
+
+def _product(left, right, p):
+    l00, l01, l10, l11 = left
+    r00, r01, r10, r11 = right
+    return (add(mul(l00, r00, p), mul(l01, r10, p), p), add(mul(l00, r01, p), mul(l01, r11, p), p),
+            add(mul(l10, r00, p), mul(l11, r10, p), p), add(mul(l10, r01, p), mul(l11, r11, p), p))
+
+
+def half_gcd(a, b, p):
+    """Compute the matrix of the steps of Euclid's algorithm which halve the degree of a, modulo p
+
+    This is the recursive half gcd of Knuth and Schonhage, in the form given by Thull and Yap: the steps are first
+    computed on the high halves of a and b, whose quotients are the same as those of a and b, then on the high
+    halves of the remainders obtained. Operands shorter than HGCD_BASE_THRESHOLD are handled by Euclid's algorithm.
+
+    :param a: A dense array longer than b
+    :param b: A dense array
+    :return: A matrix (m00, m01, m10, m11) of dense arrays, such that c = m00 * a + m01 * b and d = m10 * a + m11 * b
+             are consecutive remainders of Euclid's algorithm with deg(c) >= m > deg(d), where m = ceil(deg(a) / 2)
+    :rtype: tuple
+    """
+    m = len(a) // 2
+    if len(b) <= m:
+        return [1], [], [], [1]
+    if len(a) < HGCD_BASE_THRESHOLD:
+        matrix = [1], [], [], [1]
+        while len(b) > m:
+            quot, rest = divmod_mod(a, b, p)
+            a, b = b, rest
+            matrix = _euclid_step(matrix, quot, p)
+        return matrix
+    matrix = half_gcd(a[m:], b[m:], p)
+    a, b = _apply(matrix, a, b, p)
+    if len(b) <= m:
+        return matrix
+    quot, rest = divmod_mod(a, b, p)
+    a, b = b, rest
+    matrix = _euclid_step(matrix, quot, p)
+    k = 2 * m - len(a) + 1
+    return _product(half_gcd(a[k:], b[k:], p), matrix, p)
+
+
+def _gcd_matrix(a, b, p):
+    """Compute the matrix of Euclid's algorithm on a and b, with half gcds for long operands
+
+    :return: The tuple (g, matrix) where g = matrix[0] * a + matrix[1] * b is the last non null remainder
+    :rtype: tuple
+    """
+    matrix = [1], [], [], [1]
+    if len(a) < len(b):
+        a, b = b, a
+        matrix = [], [1], [1], []
+    while b:
+        if len(b) >= HGCD_THRESHOLD:
+            step = half_gcd(a, b, p)
+            a, b = _apply(step, a, b, p)
+            matrix = _product(step, matrix, p)
+            if not b:
+                break
+        quot, rest = divmod_mod(a, b, p)
+        a, b = b, rest
+        matrix = _euclid_step(matrix, quot, p)
+    return a, matrix
+
+
+def gcd(a, b, p):
+    """Compute the monic greatest common divisor of two dense arrays modulo p
+
+    Euclid's algorithm is used for short arrays, and half gcds from HGCD_THRESHOLD coefficients.
+
+    :rtype: list
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    while len(b) >= HGCD_THRESHOLD:
+        a, b = _apply(half_gcd(a, b, p), a, b, p)
+        if b:
+            a, b = b, divmod_mod(a, b, p)[1]
+    while b:
+        a, b = b, divmod_mod(a, b, p)[1]
+    return monic(a, p) if a else []
+
+
+def xgcd(a, b, p):
+    """Compute the monic greatest common divisor g of two dense arrays modulo p, with Bezout's coefficients
+
+    :return: A tuple (g, s, t) such that s * a + t * b = g modulo p, where s and t have less coefficients than b / g
+             and a / g
+    :rtype: tuple
+    """
+    g, (s, t, _, _) = _gcd_matrix(a, b, p)
+    if not g:
+        return [], [], []
+    inv = pow(g[-1], -1, p)
+    return scale(g, inv, p), scale(s, inv, p), scale(t, inv, p)
+
+
+def crt(residues, modulus, new_residues, p):
+    """Combine arrays of residues of the same length with Garner's step
+
+    :param residues: The array modulo modulus
+    :param new_residues: The array modulo p
+    :return: The array modulo modulus * p, of non negative ints
+    :rtype: list
+    """
+    inv = pow(modulus, -1, p)
+    return [x + modulus * ((r - x) * inv % p) for x, r in zip(residues, new_residues)]
+
+
+def rational_reconstruction(x, modulus):
+    """Find the fraction n / d equal to x modulo modulus with |n| and d lower than sqrt(modulus / 2)
+
+    :return: The fraction as an int or a Fraction, or None if there is no such fraction
+    """
+    bound = isqrt(modulus // 2)
+    r0, r1 = modulus, x % modulus
+    s0, s1 = 0, 1
+    while r1 > bound:
+        quot = r0 // r1
+        r0, r1 = r1, r0 - quot * r1
+        s0, s1 = s1, s0 - quot * s1
+    if s1 == 0 or abs(s1) > bound:
+        return None
+    if s1 < 0:
+        r1, s1 = -r1, -s1
+    return r1 if s1 == 1 else Fraction(r1, s1)
+
+
+def reconstruct(residues, modulus):
+    """Rebuild an array of fractions from their residues modulo modulus
+
+    The fractions are expected to share most of their denominators, so each residue is first multiplied by the
+    product of the denominators found so far, and the rational reconstruction is only computed when the result is
+    not already a small int.
+
+    :return: The array of ints and fractions, or None if one of them cannot be rebuilt
+    :rtype: list
+    """
+    bound = isqrt(modulus // 2)
+    half = modulus // 2
+    den, res = 1, []
+    for x in residues:
+        y = x * den % modulus
+        if y > half:
+            y -= modulus
+        if abs(y) > bound:
+            y = rational_reconstruction(y, modulus)
+            if y is None:
+                return None
+            if type(y) is not int:
+                den *= y.denominator
+                if den > bound:
+                    return None
+                y = y.numerator
+        res.append(y if den == 1 else Fraction(y, den))
+    return [x.numerator if type(x) is not int and x.denominator == 1 else x for x in res]
@@ -0,0 +1,94 @@
+"""Choice of the kernel used to multiply two dense arrays.
+
+Rational arrays are first scaled to integer arrays by clearing their denominators, so every kernel works on ints.
+The product is then computed with Karatsuba's method (see polynomials.dense) for short operands, and with Kronecker
+substitution (see polynomials.kronecker) once both operands have at least KRONECKER_THRESHOLD coefficients.
+Number theoretic transforms (see polynomials.ntt) are only used when both operands have at least NTT_THRESHOLD
+coefficients, and when the primes supporting the transform length can hold the coefficients of the product. With
+operands of 20 bits, they were measured 2.5 times slower than Kronecker substitution at 2^16 coefficients, 1.5 times
+at 2^19 and 1.14 times at 2^20 (250 s against 218 s), so the threshold is where the trend crosses over.
+
+Squares have dedicated kernels, and powers are computed by binary exponentiation on top of them, or with
+J.C.P. Miller's recurrence (see polynomials.dense.pow_miller) when the exponent is at least MILLER_RATIO times the
+degree, which was measured faster whatever the degree.
+"""
+import polynomials.dense as dense
+import polynomials.kronecker as kronecker
+import polynomials.ntt as ntt
+
+KRONECKER_THRESHOLD = 16
+NTT_THRESHOLD = 2 ** 21
+MILLER_RATIO = 2
+
+KERNELS = {
+    "karatsuba": dense.mul,
+    "kronecker": kronecker.mul,
+    "ntt": ntt.mul,
+}
+
+SQUARE_KERNELS = {
+    "karatsuba": dense.sqr,
+    "kronecker": kronecker.sqr,
+    "ntt": ntt.sqr,
+}
+
+
+def _choose(a, b):
+    length = min(len(a), len(b))
+    if length >= NTT_THRESHOLD and ntt.supports(a, b):
+        return "ntt"
+    if length >= KRONECKER_THRESHOLD:
+        return "kronecker"
+    return "karatsuba"
+
+
+def mul(a, b, method=None):
+    """Multiply two dense arrays of ints and fractions
+
+    :param method: The name of the kernel to use, one of KERNELS, by default it is chosen from the operands length
+    :type method: str
+    :rtype: list
+    """
+    if not a or not b:
+        return []
+    a, den_a = dense.clear_denominators(a)
+    b, den_b = dense.clear_denominators(b)
+    method = method or _choose(a, b)
+    return dense.divide_exact(KERNELS[method](a, b), den_a * den_b)
+
+
+def sqr(a, method=None):
+    """Square a dense array of ints and fractions
+
+    :param method: The name of the kernel to use, one of SQUARE_KERNELS, by default it is chosen from the length of a
+    :type method: str
+    :rtype: list
+    """
+    if not a:
+        return []
+    a, den = dense.clear_denominators(a)
+    return dense.divide_exact(SQUARE_KERNELS[method or _choose(a, a)](a), den * den)
+
+
+def power(a, exponent):
+    """Raise a dense array of ints and fractions to a non negative integer power
+
+    :type exponent: int
+    :rtype: list
+    """
+    if not exponent:
+        return [1]
+    if not a:
+        return []
+    # a = x^low * a[low:], with a non null constant coefficient in a[low:]
+    low = next(i for i, x in enumerate(a) if x)
+    a, den = dense.clear_denominators(a[low:])
+    if exponent >= MILLER_RATIO * (len(a) - 1):
+        res = dense.pow_miller(a, exponent)
+    else:
+        res = a
+        for bit in bin(exponent)[3:]:
+            res = SQUARE_KERNELS[_choose(res, res)](res)
+            if bit == "1":
+                res = KERNELS[_choose(res, a)](res, a)
+    return [0] * (low * exponent) + dense.divide_exact(res, den ** exponent)
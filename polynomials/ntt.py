@@ -0,0 +1,210 @@
+"""Exact multiplication of integer dense arrays with number theoretic transforms.
+
+The product is computed modulo several primes p = c * 2^MAX_LOG + 1 smaller than 2^31, and the residues are
+combined with the chinese remainder theorem. A transform of length 2^k needs 2^k to divide p - 1, so the products
+which need transforms longer than 2^MAX_LOG only use the primes whose c is divisible by 2^(k - MAX_LOG). Enough
+primes are used for their product to exceed twice the largest possible coefficient of the product, so the result is
+exact: there is no rounding involved at any step.
+"""
+from itertools import count
+
+import polynomials.dense as dense
+
+# Largest supported transform length is 2^MAX_LOG
+MAX_LOG = 22
+
+_primes = []
+# The product of the primes supporting each transform length
+_capacities = {}
+
+
+def _is_prime(n):
+    """Deterministic Miller-Rabin test for n < 3.3 * 10^24"""
+    if n < 2:
+        return False
+    small = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for p in small:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in small:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primitive_root(p):
+    factors, n = set(), p - 1
+    for f in count(2):
+        if f * f > n:
+            break
+        while n % f == 0:
+            factors.add(f)
+            n //= f
+    if n > 1:
+        factors.add(n)
+    for g in count(2):
+        if all(pow(g, (p - 1) // f, p) != 1 for f in factors):
+            return g
+
+
+def primes():
+    """Yield the primes c * 2^MAX_LOG + 1 < 2^31, from the largest one, with a primitive root of each of them
+
+    :return: An iterator of (prime, primitive root) tuples
+    """
+    yield from _primes
+    start = (2 ** 31 - 1) >> MAX_LOG if not _primes else (_primes[-1][0] >> MAX_LOG) - 1
+    for c in range(start, 0, -1):
+        p = (c << MAX_LOG) + 1
+        if _is_prime(p):
+            _primes.append((p, _primitive_root(p)))
+            yield _primes[-1]
+    raise ValueError("Not enough primes to multiply these polynomials")
+
+
+def _bound(a, b):
+    """Twice the largest possible coefficient of the product of a and b, plus one"""
+    return 2 * min(len(a), len(b)) * max(map(abs, a)) * max(map(abs, b)) + 1
+
+
+def supports(a, b):
+    """Check that there are enough primes supporting the transform length of the product of a and b to compute it
+
+    :param a: A non empty dense array of ints
+    :param b: A non empty dense array of ints
+    :rtype: bool
+    """
+    n = 1 << (len(a) + len(b) - 2).bit_length()
+    if n not in _capacities:
+        capacity = 1
+        try:
+            for p, _ in primes():
+                if (p - 1) % n == 0:
+                    capacity *= p
+        except ValueError:
+            pass
+        _capacities[n] = capacity
+    return _bound(a, b) < _capacities[n]
+
+
+def _transform(a, root, p):
+    """Decimation in frequency transform of a, in place: the output is in bit reversed order"""
+    n = len(a)
+    half = n // 2
+    while half:
+        step = 2 * half
+        w = pow(root, n // step, p)
+        ws = [1] * half
+        for j in range(1, half):
+            ws[j] = ws[j - 1] * w % p
+        if half >= n // step:
+            for i in range(0, n, step):
+                u, v = a[i:i + half], a[i + half:i + step]
+                a[i:i + half] = [(x + y) % p for x, y in zip(u, v)]
+                a[i + half:i + step] = [(x - y) * wj % p for x, y, wj in zip(u, v, ws)]
+        else:
+            for j in range(half):
+                u, v, wj = a[j::step], a[j + half::step], ws[j]
+                a[j::step] = [(x + y) % p for x, y in zip(u, v)]
+                a[j + half::step] = [(x - y) * wj % p for x, y in zip(u, v)]
+        half //= 2
+
+
+def _inverse_transform(a, root, p):
+    """Decimation in time inverse transform of a bit reversed a, in place, including the division by len(a)"""
+    n = len(a)
+    inv_root = pow(root, p - 2, p)
+    half = 1
+    while half < n:
+        step = 2 * half
+        w = pow(inv_root, n // step, p)
+        ws = [1] * half
+        for j in range(1, half):
+            ws[j] = ws[j - 1] * w % p
+        if half >= n // step:
+            for i in range(0, n, step):
+                u = a[i:i + half]
+                v = [y * wj % p for y, wj in zip(a[i + half:i + step], ws)]
+                a[i:i + half] = [(x + y) % p for x, y in zip(u, v)]
+                a[i + half:i + step] = [(x - y) % p for x, y in zip(u, v)]
+        else:
+            for j in range(half):
+                wj = ws[j]
+                u = a[j::step]
+                v = [y * wj % p for y in a[j + half::step]]
+                a[j::step] = [(x + y) % p for x, y in zip(u, v)]
+                a[j + half::step] = [(x - y) % p for x, y in zip(u, v)]
+        half = step
+    inv_n = pow(n, p - 2, p)
+    a[:] = [x * inv_n % p for x in a]
+
+
+def mul_mod(a, b, p, root):
+    """Multiply two arrays of ints modulo the prime p, without trimming the product
+
+    When b is a, the array is only transformed once.
+
+    :param root: A primitive root modulo p
+    :return: The len(a) + len(b) - 1 coefficients of the product, between 0 and p - 1
+    :rtype: list
+    """
+    length = len(a) + len(b) - 1
+    n = 1 << (length - 1).bit_length()
+    if (p - 1) % n:
+        raise ValueError(f"Transforms of length {n} are not supported modulo {p}")
+    root = pow(root, (p - 1) // n, p)
+    fa = [x % p for x in a] + [0] * (n - len(a))
+    _transform(fa, root, p)
+    if b is a:
+        fb = fa
+    else:
+        fb = [x % p for x in b] + [0] * (n - len(b))
+        _transform(fb, root, p)
+    fa = [x * y % p for x, y in zip(fa, fb)]
+    _inverse_transform(fa, root, p)
+    return fa[:length]
+
+
+def mul(a, b):
+    """Multiply two dense arrays of ints
+
+    :rtype: list
+    """
+    if not a or not b:
+        return []
+    bound = _bound(a, b)
+    n = 1 << (len(a) + len(b) - 2).bit_length()
+    res, modulus = None, 1
+    for p, root in primes():
+        if (p - 1) % n:
+            continue
+        residues = mul_mod(a, b, p, root)
+        if res is None:
+            res = residues
+        else:
+            # Garner's step: lift res from modulo modulus to modulo modulus * p
+            inv = pow(modulus, p - 2, p)
+            res = [x + modulus * ((r - x) * inv % p) for x, r in zip(res, residues)]
+        modulus *= p
+        if modulus > bound:
+            break
+    half = modulus // 2
+    return dense.trim([x - modulus if x > half else x for x in res])
+
+
+def sqr(a):
+    """Square a dense array of ints
+
+    :rtype: list
+    """
+    return mul(a, a)
@@ -0,0 +1,325 @@
+"""Isolation of the real roots of dense arrays of ints and fractions.
+
+The roots are isolated with the Vincent-Collins-Akritas algorithm. By Descartes' rule of signs, the number of
+sign variations of the coefficients of (x + 1)^n a(1 / (x + 1)) bounds the number of roots of a in (0, 1) and has
+the same parity, so no variation means no root and one variation exactly one root. The positive and negative
+roots are mapped into (0, 1) by a scaling by a power of 2 larger than the roots, then each interval whose count is
+larger than 1 is split in two halves: a(x / 2) maps the left half to (0, 1) and a((x + 1) / 2) the right half.
+Every step is an exact operation on ints, the Taylor shifts by 1 of polynomials.taylor being the main cost.
+
+The isolating intervals are refined by bisection, the signs of a at their ends being computed exactly with ints.
+
+All the complex roots are approximated with NumPy, an optional dependency imported by the functions which use it.
+The coefficients are converted once to floats, then the Aberth-Ehrlich iteration updates every estimate at each
+step with operations on arrays. If it does not converge, the roots are computed as the eigenvalues of the companion
+matrix.
+"""
+import math
+from fractions import Fraction
+from math import gcd as int_gcd
+
+import polynomials.dense as dense
+import polynomials.euclid as euclid
+import polynomials.factorization as factorization
+import polynomials.taylor as taylor
+
+# The floats are computed from ints of at most FLOAT_BITS bits, so that they do not overflow
+FLOAT_BITS = 1000
+# The starting points of the circle of each edge of the Newton polygon are rotated by this angle, so that they are
+# not symmetric with respect to the real axis
+ANGLE_OFFSET = 0.4
+MAX_ITERATIONS = 100
+# An estimate is no longer corrected once its correction is lower than TOLERANCE times its modulus
+TOLERANCE = 4e-16
+ABERTH_BLOCK = 512
+
+
+def root_bound(a):
+    """Compute a power of 2 larger than the absolute values of the roots of an array of ints, with Fujiwara's bound
+
+    :param a: A dense array of ints, with a non null constant coefficient
+    :return: The exponent k such that every root z of a is such that abs(z) < 2^k
+    :rtype: int
+    """
+    n, lead = len(a) - 1, a[-1].bit_length()
+    # abs(coef / lead)^(1 / (n - i)) < 2^ceil((coef.bit_length() - lead + 1) / (n - i))
+    return 1 + max(-((lead - coef.bit_length() - 1) // (n - i)) for i, coef in enumerate(a[:-1]) if coef)
+
+
+def _primitive(a):
+    """Divide an array of ints by the gcd of its coefficients, keeping their signs"""
+    content = int_gcd(*a)
+    return a if content == 1 else [coef // content for coef in a]
+
+
+def _scale(a, k):
+    """The primitive array of ints proportional to a(2^k x)"""
+    if k >= 0:
+        return _primitive([coef << (k * i) for i, coef in enumerate(a)])
+    n = len(a) - 1
+    return _primitive([coef << (-k * (n - i)) for i, coef in enumerate(a)])
+
+
+def isolate_unit(a):
+    """Isolate the roots of a square-free array of ints in the open interval (0, 1)
+
+    :param a: A square-free dense array of ints, whose roots are not 0 or 1
+    :return: A list of tuples (c, k, exact): if exact is True, c / 2^k is a root, else the open interval
+             (c / 2^k, (c + 1) / 2^k) contains exactly one root, and its ends are not roots
+    :rtype: list
+    """
+    res = []
+    stack = [(a, 0, 0)]
+    while stack:
+        g, c, k = stack.pop()
+        count = taylor.shifted_variations(g[::-1])
+        if count == 1:
+            res.append((c, k, False))
+        if count < 2:
+            continue
+        n = len(g) - 1
+        left = _primitive([coef << (n - i) for i, coef in enumerate(g)])
+        right = taylor.shift_one(left)
+        if not right[0]:
+            # the middle of the interval is a root, removed from both halves
+            res.append((2 * c + 1, k + 1, True))
+            left = factorization.exact_quotient(left, [-1, 1])
+            right = right[1:]
+        stack.append((right, 2 * c + 1, k + 1))
+        stack.append((left, 2 * c, k + 1))
+    return res
+
+
+def _positive_roots(a):
+    """Isolate the positive roots of a square-free array of ints, with a non null constant coefficient
+
+    :return: The list of the isolating intervals, as tuples of Fractions
+    :rtype: list
+    """
+    count = taylor.variations(a)
+    if count == 0:
+        return []
+    k = root_bound(a)
+    bound = Fraction(2) ** k
+    if count == 1:
+        return [(Fraction(0), bound)]
+    res = []
+    for c, depth, exact in isolate_unit(_scale(a, k)):
+        low = c * bound / 2 ** depth
+        res.append((low, low) if exact else (low, (c + 1) * bound / 2 ** depth))
+    return res
+
+
+def sign_at(a, x):
+    """Compute the sign of an array of ints at a Fraction, with int operations
+
+    :rtype: int
+    """
+    num, den = x.numerator, x.denominator
+    # the value at x times den^n, with Horner's rule
+    value, power = 0, 1
+    for coef in reversed(a):
+        value = value * num + coef * power
+        power *= den
+    return (value > 0) - (value < 0)
+
+
+def refine(a, low, high, precision):
+    """Refine an isolating interval of a root of a square-free array of ints by bisection
+
+    :param low: A Fraction which is not a root of a
+    :param high: A Fraction which is not a root of a, such that the open interval (low, high) contains a single root
+    :param precision: The maximal width of the refined interval
+    :return: The tuple (low, high) of the refined interval, or (root, root) if the root is found
+    :rtype: tuple
+    """
+    sign_low = sign_at(a, low)
+    while high - low > precision:
+        middle = (low + high) / 2
+        sign = sign_at(a, middle)
+        if sign == 0:
+            return middle, middle
+        if sign == sign_low:
+            low = middle
+        else:
+            high = middle
+    return low, high
+
+
+def real_roots(a, precision=None):
+    """Isolate the real roots of a dense array of ints and fractions
+
+    :param a: A non null dense array
+    :param precision: If not None, the intervals are refined until their width is at most precision
+    :return: The sorted list of tuples (low, high) of Fractions, one for each distinct real root of a, such that
+             the root is the only one in the open interval (low, high), or is equal to low if low == high
+    :rtype: list
+    """
+    if len(a) < 2:
+        return []
+    f = euclid.primitive(a)
+    f = factorization.exact_quotient(f, euclid.primitive(euclid.gcd(f, factorization.derivative(f))))
+    res = []
+    if not f[0]:
+        res.append((Fraction(0), Fraction(0)))
+        f = f[1:]
+    if len(f) > 1:
+        res.extend(_positive_roots(f))
+        negative = [-coef if i % 2 else coef for i, coef in enumerate(f)]
+        res.extend((-high, -low) for low, high in _positive_roots(negative))
+    if precision is not None:
+        res = [refine(f, low, high, precision) if low != high else (low, high) for low, high in res]
+    res.sort()
+    return res
+
+
+def float_coefficients(a):
+    """Convert a dense array of ints and fractions to floats, scaled by a power of 2 so that they do not overflow
+
+    :rtype: list
+    """
+    ints, _ = dense.clear_denominators(a)
+    excess = max(abs(coef).bit_length() for coef in ints) - FLOAT_BITS
+    scale = 1 << max(excess, 0)
+    # the true division of ints is correctly rounded
+    return [coef / scale for coef in ints]
+
+
+def initial_estimates(coefs):
+    """Compute starting points for the Aberth iteration from the Newton polygon of the coefficients
+
+    The moduli of the roots are estimated from the slopes of the upper convex hull of the points (i, log|a_i|): each
+    edge from i to j gives j - i roots of modulus exp((log|a_i| - log|a_j|) / (j - i)), spread on a circle.
+
+    :param coefs: A list of floats, with non null first and last items
+    :return: A complex128 array of len(coefs) - 1 points
+    :rtype: numpy.ndarray
+    """
+    import numpy as np
+
+    n = len(coefs) - 1
+    logs = [math.log(abs(coef)) if coef else -math.inf for coef in coefs]
+    hull = []
+    for i in range(n + 1):
+        if logs[i] == -math.inf:
+            continue
+        # pops the last point while it is not strictly above the segment from the point before to i
+        while len(hull) >= 2 and ((logs[hull[-1]] - logs[hull[-2]]) * (i - hull[-2])
+                                  <= (logs[i] - logs[hull[-2]]) * (hull[-1] - hull[-2])):
+            hull.pop()
+        hull.append(i)
+    res = np.empty(n, dtype=np.complex128)
+    for k in range(len(hull) - 1):
+        i, j = hull[k], hull[k + 1]
+        radius = math.exp((logs[i] - logs[j]) / (j - i))
+        angles = 2 * math.pi * np.arange(j - i) / (j - i) + 2 * math.pi * i / n + ANGLE_OFFSET
+        res[i:j] = radius * np.exp(1j * angles)
+    return res
+
+
+def _newton_corrections(coefs, z):
+    """Compute the Newton corrections p(z) / p'(z) of an array of points
+
+    The powers of the points larger than 1 could overflow, so the reversed array is evaluated at their inverse
+    instead, with p(z) = z^n q(1 / z) and p(z) / p'(z) = z / (n - q'(1 / z) / (z q(1 / z))).
+
+    :return: A tuple (corrections, converged) where converged tells if p(z) is as small as the rounding errors of
+             Horner's rule, in which case the point cannot be improved
+    :rtype: tuple
+    """
+    import numpy as np
+
+    n = len(coefs) - 1
+    outside = np.abs(z) > 1
+    x = np.where(outside, 1 / z, z)
+    modulus = np.abs(x)
+    value, deriv, bound = np.zeros_like(z), np.zeros_like(z), np.zeros_like(modulus)
+    reversed_value, reversed_deriv, reversed_bound = np.zeros_like(z), np.zeros_like(z), np.zeros_like(modulus)
+    for coef, reversed_coef in zip(reversed(coefs), coefs):
+        deriv = deriv * x + value
+        value = value * x + coef
+        bound = bound * modulus + abs(coef)
+        reversed_deriv = reversed_deriv * x + reversed_value
+        reversed_value = reversed_value * x + reversed_coef
+        reversed_bound = reversed_bound * modulus + abs(reversed_coef)
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        corrections = np.where(outside, z / (n - x * reversed_deriv / reversed_value), value / deriv)
+    residual = np.where(outside, np.abs(reversed_value) / reversed_bound, np.abs(value) / bound)
+    return corrections, residual <= 4 * n * np.finfo(np.float64).eps
+
+
+def aberth(coefs, max_iterations=MAX_ITERATIONS):
+    """Compute the roots of a polynomial with the simultaneous iteration of Aberth and Ehrlich
+
+    Each estimate z_k is corrected by w_k = N_k / (1 - N_k * sum(1 / (z_k - z_j) for j != k)), where N_k is the
+    Newton correction p(z_k) / p'(z_k). The corrections of all the estimates are computed together with NumPy, the
+    sums on rows of ABERTH_BLOCK estimates to bound the memory used. An estimate is no longer updated once its
+    correction is small enough or once p(z_k) is as small as the rounding errors.
+
+    :param coefs: A list of floats, with non null first and last items
+    :return: A complex128 array of the roots, or None if the iteration does not converge
+    :rtype: numpy.ndarray
+    """
+    import numpy as np
+
+    z = initial_estimates(coefs)
+    n = len(z)
+    active = np.arange(n)
+    for _ in range(max_iterations):
+        ratio, converged = _newton_corrections(coefs, z[active])
+        sums = np.empty(len(active), dtype=np.complex128)
+        # coinciding estimates give infinite or undefined corrections, which stop the iteration below
+        with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+            for start in range(0, len(active), ABERTH_BLOCK):
+                rows = active[start:start + ABERTH_BLOCK]
+                inverse = 1 / (z[rows, None] - z[None, :])
+                inverse[np.arange(len(rows)), rows] = 0
+                sums[start:start + ABERTH_BLOCK] = inverse.sum(axis=1)
+            correction = ratio / (1 - ratio * sums)
+        if not np.all(np.isfinite(correction)):
+            return None
+        z[active] -= correction
+        active = active[~converged & (np.abs(correction) > TOLERANCE * np.abs(z[active]))]
+        if not len(active):
+            return z
+    return None
+
+
+def companion(coefs):
+    """Compute the roots of a polynomial as the eigenvalues of its companion matrix
+
+    :param coefs: A list of floats, with a non null last item
+    :rtype: numpy.ndarray
+    """
+    import numpy as np
+
+    n = len(coefs) - 1
+    matrix = np.zeros((n, n))
+    matrix[1:, :-1] = np.eye(n - 1)
+    matrix[:, -1] = -np.array(coefs[:-1]) / coefs[-1]
+    return np.linalg.eigvals(matrix).astype(np.complex128)
+
+
+def numeric_roots(a, method="aberth"):
+    """Approximate all the complex roots of a dense array of ints and fractions, with their multiplicities
+
+    :param a: A non null dense array
+    :param method: "aberth" for the Aberth iteration, which falls back to the companion matrix if it does not
+                   converge, or "companion" for the eigenvalues of the companion matrix
+    :return: A complex128 array of the deg(a) roots, sorted by real parts then imaginary parts
+    :rtype: numpy.ndarray
+    """
+    import numpy as np
+
+    if method not in ("aberth", "companion"):
+        raise ValueError(f"Unknown root finding method: {method}")
+    zeros = next(i for i, coef in enumerate(a) if coef)
+    coefs = float_coefficients(a[zeros:])
+    res = None
+    if len(coefs) > 1:
+        if method == "aberth":
+            res = aberth(coefs)
+        if res is None:
+            res = companion(coefs)
+    res = np.concatenate([np.zeros(zeros, dtype=np.complex128), res if res is not None else []])
+    return res[np.lexsort((res.imag, res.real))]
@@ -0,0 +1,155 @@
+"""Arithmetic kernels working on sparse coefficient mappings.
+
+A sparse mapping is a dict associating each degree with the coefficient of the monomial of this degree. The mappings
+returned by these functions only hold non null coefficients, so the null polynomial is the empty dict.
+
+A polynomial is stored as a sparse mapping when its density, the number of non null coefficients divided by the
+number of coefficients of its dense array, is lower than DENSITY, so that the cost of the operations depends on
+the number of terms rather than on the degree.
+"""
+from math import perm
+
+import polynomials.Monomial as Monomial
+
+# Polynomials which have less non null coefficients than DENSITY times their degree are stored as sparse mappings
+DENSITY = 1 / 8
+# Polynomials with a degree lower than MIN_DEGREE are always dense
+MIN_DEGREE = 64
+
+
+def from_monomials(monomials):
+    """Merge monomials into a sparse mapping
+
+    :param monomials: An iterable of Monomial, in any order, which may contain several monomials of the same degree
+    :return: The sparse mapping of the sum of the monomials
+    :rtype: dict
+    """
+    terms = {}
+    for mono in monomials:
+        if mono.coef:
+            if mono.deg < 0:
+                raise ValueError("A polynomial cannot contain monomials with a negative degree")
+            terms[mono.deg] = terms.get(mono.deg, 0) + mono.coef
+    return {deg: coef for deg, coef in terms.items() if coef}
+
+
+def from_dense(coefs):
+    """Convert a dense array to a sparse mapping
+
+    :rtype: dict
+    """
+    return {deg: coef for deg, coef in enumerate(coefs) if coef}
+
+
+def to_dense(terms):
+    """Convert a sparse mapping to a trimmed dense array
+
+    :rtype: list
+    """
+    coefs = [0] * (max(terms, default=-1) + 1)
+    for deg, coef in terms.items():
+        coefs[deg] = coef
+    return coefs
+
+
+def pack(terms):
+    """Choose the layout of a polynomial according to its density
+
+    :param terms: A trimmed dense array or a sparse mapping
+    :type terms: list or dict
+    :return: A sparse mapping if the polynomial is sparse, else a dense array, holding the same coefficients
+    :rtype: list or dict
+    """
+    if isinstance(terms, dict):
+        deg = max(terms, default=0)
+        if deg < MIN_DEGREE or len(terms) >= DENSITY * (deg + 1):
+            return to_dense(terms)
+        return terms
+    if len(terms) <= MIN_DEGREE:
+        return terms
+    non_null = len(terms) - terms.count(0)
+    if non_null < DENSITY * len(terms):
+        return from_dense(terms)
+    return terms
+
+
+def add(a, b):
+    """Add two sparse mappings
+
+    :rtype: dict
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    res = dict(a)
+    for deg, coef in b.items():
+        coef += res.get(deg, 0)
+        if coef:
+            res[deg] = coef
+        else:
+            res.pop(deg, None)
+    return res
+
+
+def sub(a, b):
+    """Subtract the sparse mapping b from the sparse mapping a
+
+    :rtype: dict
+    """
+    res = dict(a)
+    for deg, coef in b.items():
+        coef = res.get(deg, 0) - coef
+        if coef:
+            res[deg] = coef
+        else:
+            res.pop(deg, None)
+    return res
+
+
+def neg(a):
+    """Negate a sparse mapping
+
+    :rtype: dict
+    """
+    return {deg: -coef for deg, coef in a.items()}
+
+
+def mul(a, b):
+    """Multiply two sparse mappings with the schoolbook method, in O(len(a) * len(b))
+
+    :rtype: dict
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    res = {}
+    for deg_b, coef_b in b.items():
+        for deg_a, coef_a in a.items():
+            deg = deg_a + deg_b
+            res[deg] = res.get(deg, 0) + coef_a * coef_b
+    return {deg: coef for deg, coef in res.items() if coef}
+
+
+def mul_monomial(a, coef, deg):
+    """Multiply a sparse mapping by the monomial coef * x^deg
+
+    :rtype: dict
+    """
+    if not coef:
+        return {}
+    return {d + deg: c * coef for d, c in a.items()}
+
+
+def evaluate(a, val):
+    """Evaluate a sparse mapping at a value
+
+    :rtype: int or Fraction
+    """
+    return sum(coef * val ** deg for deg, coef in a.items())
+
+
+def derive(a, n=1):
+    """Compute the n-th derivative of a sparse mapping, multiplying each coefficient by a falling factorial
+
+    :param n: A non negative int
+    :rtype: dict
+    """
+    return {deg - n: Monomial.exact(coef * perm(deg, n)) for deg, coef in a.items() if deg >= n}
@@ -1,5 +1,6 @@
 from pyparsing import ParseException, Word, alphas, alphanums
 from PolynomialBNF import get_BNF, expr_stack, evaluate_stack, prepare_input
+from polynomials import Polynomial
 
 
 class PolynomialParser:
@@ -38,11 +39,14 @@ class PolynomialParser:
                 for i, ob in enumerate(expr_stack):
                     if isinstance(ob, str) and ob in self.variables:
                         expr_stack[i] = str(self.variables[ob])
+                    elif isinstance(ob, tuple) and ob[0] in self.variables:
+                        # a variable called with arguments, p(q) is the composition of p with q
+                        expr_stack[i] = (Polynomial(str(self.variables[ob[0]])), ob[1])
 
                 # calculate result , store a copy in ans , display the result to user
                 try:
                     stack_eval = evaluate_stack(expr_stack)
-                    result += stack_eval + "\n"
+                    result += f"{stack_eval}\n"
                 except Exception as e:
                     result += str(e) + "\n"
                 else:
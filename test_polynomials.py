@@ -1,6 +1,16 @@
 import unittest
+import warnings
+from fractions import Fraction
+from unittest import mock
 
-from polynomials import Polynomial, Monomial, ModuloPolynomial, RationalPolynomial
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from polynomials import Polynomial, Monomial, ModuloPolynomial, RationalPolynomial, SubproductTree
+from polynomials import multiplication, ntt, roots
+from polyparse import PolynomialParser
 
 
 class MonomialTestCase(unittest.TestCase):
@@ -31,6 +41,11 @@ class MonomialTestCase(unittest.TestCase):
     def test_division(self):
         pass
 
+    def test_coefficients(self):
+        self.assertEqual(Fraction(1, 3000001), Monomial(Fraction(1, 3000001)).coef)
+        self.assertEqual(Fraction(1, 3), Monomial(1 / 3).coef)
+        self.assertFalse(hasattr(Monomial(1), "__dict__"))
+
 
 class PolynomialTestCase(unittest.TestCase):
     def setUp(self) -> None:
@@ -55,6 +70,54 @@ class PolynomialTestCase(unittest.TestCase):
         m = Polynomial("x^2+5x+4")
         self.assertEqual(m, p * q)
 
+    def test_large_multiplication(self):
+        p = Polynomial([Monomial((-1) ** i * (i % 7), i) for i in range(300)])
+        q = Polynomial([Monomial(i % 5 + 1, i) for i in range(200)])
+        product = p * q
+        self.assertEqual(498, product.deg())
+        self.assertEqual(p(2) * q(2), product(2))
+        self.assertEqual(p(Fraction(-1, 3)) * q(Fraction(-1, 3)), product(Fraction(-1, 3)))
+
+    def test_transform_multiplication(self):
+        p = Polynomial([Monomial(Fraction(10 ** 40 + i, i % 3 + 1), i) for i in range(400)])
+        q = Polynomial([Monomial(-(i % 11) * 7 ** i, i) for i in range(300)])
+        product = p * q
+        self.assertEqual(698, product.deg())
+        self.assertEqual(p(3) * q(3), product(3))
+        self.assertEqual(p(Fraction(2, 5)) * q(Fraction(2, 5)), product(Fraction(2, 5)))
+
+    def test_multiplication_kernels(self):
+        a = [(-3) ** i * (i % 4) for i in range(40)] + [-1]
+        b = [Fraction(i - 20, i % 6 + 1) for i in range(30)]
+        products = [multiplication.mul(a, b, method) for method in multiplication.KERNELS]
+        self.assertEqual(products[0], products[1])
+        self.assertEqual(products[0], products[2])
+
+    def test_ntt_long_transforms(self):
+        # the product needs a transform of length 32 and 4 primes, only half of the primes c * 2^4 + 1 support it
+        a = [(-1) ** i * (2 ** 50 + i) for i in range(9)]
+        b = [2 ** 51 - 3 * i for i in range(9)]
+        with mock.patch.object(ntt, "MAX_LOG", 4), mock.patch.object(ntt, "_primes", []):
+            self.assertEqual(multiplication.mul(a, b, "karatsuba"), ntt.mul(a, b))
+
+    def test_ntt_capacity(self):
+        # the primes supporting transforms of length 32 hold about 1200 bits, less than the coefficients of big^2
+        a, big = list(range(1, 17)), [2 ** 1000 + i for i in range(16)]
+        with mock.patch.object(multiplication, "NTT_THRESHOLD", 16):
+            self.assertEqual("ntt", multiplication._choose(a, a))
+            self.assertEqual("kronecker", multiplication._choose(big, big))
+            self.assertEqual(multiplication.mul(big, big, "karatsuba"), multiplication.sqr(big))
+
+    def test_power(self):
+        p = Polynomial("1/2x^3-x^2+2x")
+        q = Polynomial("x^5-2x^4+3x^3-4x^2+5x-6")
+        self.assertEqual(p * p * p * p * p, p ** 5)
+        self.assertEqual(q * q * q, q ** 3)
+        self.assertEqual(1, p ** 0)
+        self.assertEqual(2 ** 1000, (Polynomial("x+1") ** 1000)(1))
+        self.assertEqual(Polynomial("x^200000+2x^100000+1"), Polynomial("x^100000+1") ** 2)
+        self.assertRaises(ValueError, lambda: p ** -1)
+
     def test_division(self):
         p = Polynomial("3x^3+1")
         q = Polynomial("x+4")
@@ -63,6 +126,236 @@ class PolynomialTestCase(unittest.TestCase):
         self.assertEqual(Polynomial("x^3+1/3"), p / 3)
         self.assertEqual(Polynomial("9/2x^3+3/2"), p / (2 / 3))
 
+    def test_negation(self):
+        p = Polynomial("3x^2-x+1/2")
+        self.assertEqual(Polynomial("-3x^2+x-1/2"), -p)
+        self.assertEqual(0, p - p)
+        self.assertEqual(Polynomial("-x+3"), 3 - Polynomial("x"))
+
+    def test_degree(self):
+        self.assertEqual(0, Polynomial(0).deg())
+        self.assertEqual(4, Polynomial("x^4+x").deg())
+        self.assertEqual(1, (Polynomial("x^4+x") - Polynomial("x^4")).deg())
+
+    def test_sparse(self):
+        p = Polynomial("x^200000+3x^5-1")
+        self.assertEqual(200000, p.deg())
+        self.assertEqual(Polynomial("2x^200000+6x^5-2"), p + p)
+        self.assertEqual(Polynomial("3x^5-1"), p - Polynomial("x^200000"))
+        self.assertEqual("x^200000+3x^5-1", str(p))
+        self.assertEqual(Polynomial("x^400000+6x^200005-2x^200000+9x^10-6x^5+1"), p * p)
+        # products of sparse and dense polynomials, or of sparse ones with many terms, use the dense kernels
+        q = Polynomial([Monomial(i % 7 + 1, 50 * i) for i in range(100)])
+        r = Polynomial([Monomial(i % 5 - 2, i) for i in range(300)])
+        self.assertEqual(sum((r * mono for mono in q), Polynomial()), q * r)
+        self.assertEqual(sum((q * mono for mono in q), Polynomial()), q * q)
+
+    def test_normalization(self):
+        p = Polynomial("1+x-3x^2+x+3x^2")
+        self.assertEqual("2x+1", str(p))
+        self.assertEqual(2, len(p))
+        p.append(Monomial(1, 3))
+        self.assertEqual("x^3+2x+1", str(p.reorder()))
+        self.assertEqual("1+2x+x^3", str(p.reorder(reverse=False)))
+
+    def test_integer_coefficients(self):
+        p = (Polynomial("2x^2-3x+1") * Polynomial("x-4")) ** 3
+        self.assertTrue(all(type(mono.coef) is int for mono in p.derive()))
+        self.assertIs(int, type(p(7)))
+        q, _ = p / Polynomial("2x+1")
+        self.assertIn(Fraction, {type(mono.coef) for mono in q})
+        self.assertIs(int, type((Polynomial("1/2x") * 2)[0].coef))
+
+    def test_divmod(self):
+        p = Polynomial("x^3-1")
+        q = Polynomial("x-1")
+        self.assertEqual((Polynomial("x^2+x+1"), Polynomial(0)), divmod(p, q))
+        self.assertEqual(Polynomial("x^2+x+1"), p // q)
+        self.assertEqual(0, p % q)
+        self.assertEqual((Polynomial(0), q), divmod(q, p))
+        self.assertEqual(Polynomial("1/2"), Polynomial(3) // Polynomial(6))
+        self.assertRaises(ZeroDivisionError, divmod, p, Polynomial(0))
+
+    def test_large_division(self):
+        b = Polynomial([Monomial(Fraction(i % 13 - 6, i % 4 + 1), i) for i in range(150)] + [Monomial(3, 150)])
+        q = Polynomial([Monomial(i % 7 - 3, i) for i in range(201)])
+        r = Polynomial([Monomial(i % 5, i) for i in range(150)])
+        self.assertEqual((q, r), divmod(b * q + r, b))
+
+    def test_evaluation(self):
+        p = Polynomial("1/2x^3-3x^2+x-5/3")
+        self.assertEqual(Fraction(-5, 3), p(0))
+        self.assertEqual(Fraction(-23, 3), p(2))
+        self.assertEqual(Fraction(-2273, 1029), p(Fraction(-2, 7)))
+        self.assertEqual(Fraction(-23, 3), p(2.0))
+        self.assertEqual(2 ** 100000 + 1, Polynomial("x^100000+1")(2))
+
+    def test_multi_eval(self):
+        p = Polynomial("1/2x^3-3x^2+x-5/3")
+        points = [0, 2, Fraction(-2, 7), 2.0]
+        self.assertEqual([p(x) for x in points], p.multi_eval(points))
+        self.assertEqual([2, 0, 0], Polynomial("x^100001+1").multi_eval([1, -1, -1]))
+        self.assertEqual([5, 4, 3], p.multi_eval(SubproductTree([1, 2, 3], 7)))
+
+    def test_interpolate(self):
+        self.assertEqual(Polynomial("x^2+1"), Polynomial.interpolate([0, 1, 2], [1, 2, 5]))
+        self.assertEqual(Polynomial("-5/4x+15/8"), Polynomial.interpolate([0.5, 1.5], [1.25, 0]))
+        subclass = type("Subclass", (Polynomial,), {})
+        self.assertIsInstance(subclass.interpolate([0, 1], [1, 2]), subclass)
+        p = Polynomial([Monomial(Fraction(i % 7 - 3, i % 5 + 1), i) for i in range(100)])
+        points = [Fraction(i, 3) for i in range(-50, 50)]
+        self.assertEqual(p, Polynomial.interpolate(points, p.multi_eval(points)))
+        values = [i * i % 17 for i in range(60)]
+        self.assertEqual(values, Polynomial.interpolate(range(60), values).multi_eval(range(60)))
+        with self.assertRaises(ValueError):
+            Polynomial.interpolate([1, 2, 1], [1, 2, 3])
+
+    def test_gcd(self):
+        p, q = Polynomial("x^2-x-2"), Polynomial("x^2+4x+3")
+        self.assertEqual(Polynomial("x+1"), p.gcd(q))
+        self.assertEqual(Polynomial("x+1"), Polynomial("2x+2").gcd("4x+4"))
+        self.assertEqual(Polynomial("x^3+2x^2-5x-6"), p.lcm(q))
+        self.assertEqual(Polynomial("x^2+4x+3"), Polynomial(0).gcd(q))
+        self.assertEqual(1, Polynomial("x^2+1").gcd("x-1"))
+        g, s, t = p.xgcd(q)
+        self.assertEqual((Polynomial("x+1"), Polynomial("-1/5"), Polynomial("1/5")), (g, s, t))
+        # large enough for the modular algorithm
+        g = Polynomial([Monomial(Fraction(3 ** i, i + 1), i) for i in range(20)])
+        p *= g * Polynomial([Monomial(2 ** i - 7, i) for i in range(25)])
+        q *= g * Polynomial([Monomial(5 - i * i, i) for i in range(25)])
+        g, s, t = p.xgcd(q)
+        self.assertEqual(p.gcd(q), g)
+        self.assertEqual(g, s * p + t * q)
+        self.assertEqual(0, p % g)
+        self.assertEqual(0, p.lcm(q) % q)
+
+    def test_compose(self):
+        p, q = Polynomial("x^2+1"), Polynomial("x-1")
+        self.assertEqual(Polynomial("x^2-2x+2"), p(q))
+        self.assertEqual(Polynomial("x^6+1"), p(Monomial(1, 3)))
+        self.assertEqual(Polynomial("4x^2+1"), p.compose("2x"))
+        self.assertEqual(Polynomial("-2x+2"), p.compose(q, "x^2"))
+        # long enough to be split in halves
+        p = Polynomial([Monomial(Fraction(i % 5 - 2, i % 3 + 1), i) for i in range(40)])
+        q = Polynomial([Monomial(i % 4 - 1, i) for i in range(10)])
+        expected = Polynomial(0)
+        for mono in reversed(p.reorder(reverse=False, with_null_coefs=True, max_deg=p.deg())):
+            expected = expected * q + mono.coef
+        self.assertEqual(expected, p(q))
+        f = Polynomial("x^5-3x+1/2")
+        self.assertEqual(expected % f, p.compose(q, f))
+        self.assertRaises(ValueError, p.compose, q, 2)
+
+    def test_shift(self):
+        p = Polynomial("x^3-2x+1/2")
+        self.assertEqual(Polynomial("x^3+3x^2+x-1/2"), p.shift(1))
+        self.assertEqual(p(Polynomial("x-2/3")), p.shift(Fraction(-2, 3)))
+        self.assertEqual(p, p.shift(0))
+        self.assertEqual(Polynomial(7), Polynomial(7).shift(5))
+        p = Polynomial([Monomial((-1) ** i * (i % 9), i) for i in range(300)])
+        self.assertEqual(p(Fraction(5, 2)), p.shift(Fraction(3, 4))(Fraction(7, 4)))
+        self.assertEqual(Polynomial("3x+4")(Polynomial("x+1")), Polynomial("3x+4").shift(1))
+
+    def test_derive(self):
+        p = Polynomial("3x^5-1/2x^4+2x^2-7")
+        self.assertEqual(Polynomial("180x^2-12x"), p.derive(3))
+        self.assertEqual(p.derive().derive().derive(), p.derive(3))
+        self.assertEqual(p, p.derive(0))
+        self.assertEqual(0, p.derive(6))
+        self.assertEqual(Polynomial([Monomial(200000 * 199999, 199998), Monomial(60, 3)]),
+                         Polynomial("x^200000+3x^5-1").derive(2))
+        self.assertEqual(Monomial(Fraction(60, 7), 2), Monomial(Fraction(1, 7), 5).derive(3))
+        with self.assertRaises(ValueError):
+            p.derive(-1)
+
+    def test_taylor_at(self):
+        p = Polynomial("3x^5-1/2x^4+2x^2-7")
+        for val in (0, 2, Fraction(-3, 4)):
+            self.assertEqual([p.derive(k)(val) for k in range(6)], p.taylor_at(val))
+        self.assertEqual([p(2), p.derive()(2), p.derive(2)(2)], p.taylor_at(2, 2))
+        self.assertEqual(p.taylor_at(1) + [0, 0], p.taylor_at(1, 7))
+        self.assertEqual([0], Polynomial().taylor_at(5))
+
+    @unittest.skipUnless(numpy, "NumPy is not installed")
+    def test_roots(self):
+        p = Polynomial("x^5-x")
+        for method in ("aberth", "companion"):
+            # rounded, so that the order does not depend on the rounding errors on the real parts
+            self.assertTrue(numpy.allclose([-1, -1j, 0, 1j, 1], numpy.sort_complex(p.roots(method).round(8))))
+        self.assertTrue(numpy.allclose([-2, -2, Fraction(1, 3)], Polynomial("3x^3+11x^2+8x-4").roots(), atol=1e-6))
+        zeros = Polynomial("x^300-2").roots()
+        self.assertEqual(300, len(zeros))
+        self.assertTrue(numpy.allclose(2 ** (1 / 300), abs(zeros)))
+        self.assertTrue(numpy.allclose(2, zeros ** 300))
+        self.assertRaises(ValueError, p.roots, "newton")
+        # coinciding estimates stop the iteration without warnings
+        with mock.patch.object(roots, "initial_estimates", lambda coefs: numpy.ones(len(coefs) - 1, complex)):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", RuntimeWarning)
+                self.assertIsNone(roots.aberth([1.0, 0.0, 1.0, 2.0]))
+
+    def test_real_roots(self):
+        p = Polynomial("x^2-2")
+        self.assertEqual([(Fraction(-4), Fraction(0)), (Fraction(0), Fraction(4))], p.real_roots())
+        for low, high in p.real_roots(1e-12):
+            self.assertTrue(0 < high - low <= 1e-12)
+            self.assertTrue(p(low) * p(high) < 0)
+        # the dyadic roots 0 and 1/2 are found exactly, here while refining for 1/2
+        p = Polynomial("x^2") * Polynomial("2x-1") * Polynomial("x^2-3") * Polynomial("x^2+1")
+        roots = p.real_roots(Fraction(1, 10))
+        self.assertEqual(4, len(roots))
+        self.assertEqual((0, 0), roots[1])
+        self.assertEqual((Fraction(1, 2), Fraction(1, 2)), roots[2])
+        self.assertTrue(roots[0][0] < -3 ** 0.5 < roots[0][1] and roots[3][0] < 3 ** 0.5 < roots[3][1])
+        wilkinson = Polynomial(1)
+        for i in range(1, 21):
+            wilkinson *= Polynomial([Monomial(1, 1), Monomial(-i, 0)])
+        self.assertEqual(20, len((wilkinson + 1).real_roots()))
+        self.assertEqual([], Polynomial("x^4+1").real_roots())
+        self.assertRaises(ValueError, Polynomial(0).real_roots)
+
+    def test_squarefree_decomposition(self):
+        p = Polynomial("-1/3x^2-1/3") * Polynomial("2x-1") ** 2 * Polynomial("x+1") ** 3
+        self.assertEqual((Fraction(-1, 3), [(Polynomial("x^2+1"), 1), (Polynomial("2x-1"), 2), (Polynomial("x+1"), 3)]),
+                         p.squarefree_decomposition())
+        self.assertEqual((5, []), Polynomial(5).squarefree_decomposition())
+        with self.assertRaises(ValueError):
+            Polynomial(0).squarefree_decomposition()
+
+    def test_factor(self):
+        self.assertEqual((1, [(Polynomial("x-1"), 1), (Polynomial("x+1"), 1), (Polynomial("x^2+1"), 1)]),
+                         Polynomial("x^4-1").factor())
+        self.assertEqual((Fraction(-1, 2), [(Polynomial("x-1"), 1), (Polynomial("x+1"), 1)]),
+                         Polynomial("1/2-1/2x^2").factor())
+        self.assertEqual((2, [(Polynomial("x"), 2), (Polynomial("x+1"), 3)]),
+                         (Polynomial("2x^2") * Polynomial("x+1") ** 3).factor())
+        # irreducible, but split into factors of degree at most 2 modulo every prime
+        self.assertEqual((1, [(Polynomial("x^4-10x^2+1"), 1)]), Polynomial("x^4-10x^2+1").factor())
+        p = Polynomial("3x^5-7x+2") * Polynomial("x^6+x^3-x+1") ** 2 * Polynomial("5x^4-x^3+11") * 7
+        content, factors = p.factor()
+        self.assertEqual(7, content)
+        self.assertEqual([4, 5, 6], [factor.deg() for factor, _ in factors])
+        product = Polynomial(content)
+        for factor, multiplicity in factors:
+            product *= factor ** multiplicity
+        self.assertEqual(p, product)
+        with self.assertRaises(ValueError):
+            Polynomial(0).factor()
+
+    @unittest.skipUnless(numpy, "NumPy is not installed")
+    def test_eval_many(self):
+        p = Polynomial("1/2x^3-3x^2+x-5/3")
+        points = numpy.linspace(-2, 2, 9).reshape(3, 3)
+        expected = numpy.array([[float(p(x)) for x in row] for row in points])
+        self.assertTrue(numpy.allclose(expected, p.eval_many(points)))
+        self.assertTrue(numpy.allclose(expected, p.eval_many(points, chunk_size=2)))
+        self.assertTrue(numpy.allclose([2, 2, 1], Polynomial("x^1000+1").eval_many([1, -1, 0.5])))
+        self.assertAlmostEqual(complex(4 / 3, 1 / 2), p.eval_many([1j])[0])
+        self.assertEqual([Fraction(-5, 3), Fraction(-23, 3)], list(p.eval_many([0, 2], exact=True)))
+        for chunk_size in (0, -2):
+            with self.assertRaises(ValueError):
+                p.eval_many(points, chunk_size=chunk_size)
+
     def test_equality(self):
         self.assertEqual(0, Polynomial(0))
         self.assertEqual(0, Polynomial((Monomial(0, 0), Monomial(0, 0))))
@@ -80,9 +373,98 @@ class ModuloPolynomialTestCase(unittest.TestCase):
         p3 = ModuloPolynomial("7x-6+5x^3-15")
         s = ModuloPolynomial("2x")
         self.assertEqual(s, p1 + p2)
+        self.assertEqual(ModuloPolynomial("3x"), ModuloPolynomial("1/2x"))
+        with self.assertRaisesRegex(ValueError, "coefficient 1/2 is not invertible modulo 4"):
+            ModuloPolynomial("1/2x", 4)
         self.assertEqual(ModuloPolynomial("3x+3"), p2 + p3)
         self.assertIsInstance(-p2-p3, ModuloPolynomial)
 
+    def test_multi_eval(self):
+        p = ModuloPolynomial(Polynomial([Monomial(i * i + 1, i) for i in range(100)]), 101)
+        points = list(range(-20, 60))
+        self.assertEqual([p(x) % 101 for x in points], p.multi_eval(points))
+        tree = SubproductTree(points, 101)
+        self.assertEqual([(x * x + 1) % 101 for x in points], ModuloPolynomial("x^2+1", 101).multi_eval(tree))
+        self.assertEqual([1, 5, 4, 5, 1, 6, 6], ModuloPolynomial("x^200000+3x+1", 7).multi_eval(range(7)))
+        q = ModuloPolynomial.interpolate(range(3), [1, 2, 5], 7)
+        self.assertIsInstance(q, ModuloPolynomial)
+        self.assertEqual(ModuloPolynomial("x^2+1", 7), q)
+        with self.assertRaises(ValueError):
+            p.multi_eval(SubproductTree(points, 7))
+
+    def test_gcd(self):
+        p, q = ModuloPolynomial("x^2-x-2", 7), ModuloPolynomial("x^2+4x+3", 7)
+        self.assertEqual(ModuloPolynomial("x+1", 7), p.gcd(q))
+        self.assertEqual(ModuloPolynomial("x^3+2x^2+2x+1", 7), p.lcm(q))
+        mod = 2 ** 61 - 1
+        g = ModuloPolynomial(Polynomial([Monomial(i * i + 3, i) for i in range(300)]) + Monomial(1, 300), mod)
+        a = g * ModuloPolynomial(Polynomial([Monomial(7 * i + 1, i) for i in range(400)]), mod)
+        b = g * ModuloPolynomial(Polynomial([Monomial(i + 5, i) for i in range(350)]), mod)
+        self.assertEqual(g, a.gcd(b))
+        d, s, t = a.xgcd(b)
+        self.assertEqual(g, d)
+        self.assertEqual(d, s * a + t * b)
+        with self.assertRaises(ValueError):
+            p.gcd(ModuloPolynomial("x+1", 5))
+
+    def test_powmod(self):
+        p, f = ModuloPolynomial("x^2+3", 7), ModuloPolynomial("2x^3+x+1", 7)
+        self.assertEqual(ModuloPolynomial(p ** 20 % f, 7), p.powmod(20, f))
+        x = ModuloPolynomial("x", 7)
+        self.assertEqual(x, x.powmod(7 ** 3, ModuloPolynomial("x^3+x+1", 7)))
+        with self.assertRaises(ValueError):
+            p.powmod(-1, f)
+
+    def test_compose(self):
+        p, q = ModuloPolynomial("x^3+2x+1", 5), ModuloPolynomial("x^2+4", 5)
+        self.assertEqual(ModuloPolynomial("x^6+2x^4+3", 5), p(q))
+        self.assertEqual(ModuloPolynomial("x^6+2x^4+3", 5), p(Polynomial("x^2-1")))
+        self.assertEqual(ModuloPolynomial("4x^2+4", 5), p.compose(q, ModuloPolynomial("2x^3+2x+2", 5)))
+        p = ModuloPolynomial(Polynomial([Monomial(i * i + 1, i) for i in range(50)]), 101)
+        q = ModuloPolynomial(Polynomial([Monomial(7 * i + 3, i) for i in range(12)]), 101)
+        f = ModuloPolynomial("x^7+5x+1", 101)
+        expected = ModuloPolynomial(p.to_polynomial()(q.to_polynomial()), 101)
+        self.assertEqual(expected, p(q))
+        self.assertEqual(ModuloPolynomial(expected.to_polynomial() % f.to_polynomial(), 101), p.compose(q, f))
+
+    def test_shift(self):
+        p = ModuloPolynomial("x^3+2x+1", 5)
+        self.assertEqual(ModuloPolynomial("x^3+3x^2+4", 5), p.shift(1))
+        self.assertEqual(p(ModuloPolynomial("x+3", 5)), p.shift(Fraction(1, 2)))
+
+    def test_squarefree_decomposition(self):
+        # x - 2 = x + 1 modulo 3
+        p = ModuloPolynomial(Polynomial("2x^2+2") * Polynomial("x+1") ** 3 * Polynomial("x-2") ** 4, 3)
+        self.assertEqual((2, [(ModuloPolynomial("x^2+1", 3), 1), (ModuloPolynomial("x+1", 3), 7)]),
+                         p.squarefree_decomposition())
+        # the derivative of x^3 + 1 = (x + 1)^3 is null modulo 3
+        p = ModuloPolynomial("x^3+1", 3)
+        self.assertEqual((1, [(ModuloPolynomial("x+1", 3), 3)]), p.squarefree_decomposition())
+        with self.assertRaises(ValueError):
+            ModuloPolynomial("x^2", 4).squarefree_decomposition()
+
+    def test_factor(self):
+        lead, factors = ModuloPolynomial("3x^5+3x^4+6x^3+5x^2+x+3", 7).factor()
+        self.assertEqual(3, lead)
+        self.assertEqual([(ModuloPolynomial("x+5", 7), 1), (ModuloPolynomial("x+6", 7), 2),
+                          (ModuloPolynomial("x^2+5x+3", 7), 1)], factors)
+        self.assertEqual([(ModuloPolynomial("x+1", 2), 4)], ModuloPolynomial("x^4+1", 2).factor()[1])
+        self.assertEqual(101, len(ModuloPolynomial("x^101-x", 101).factor()[1]))
+        mod = 2 ** 31 - 1
+        p = ModuloPolynomial(Polynomial([Monomial(i ** 3 + 7, i) for i in range(60)]), mod)
+        p = p * p * ModuloPolynomial("x^2+1", mod)
+        for prime in (3, mod):
+            lead, factors = ModuloPolynomial(p, prime).factor()
+            product = ModuloPolynomial(lead, prime)
+            for factor, multiplicity in factors:
+                product = product * ModuloPolynomial(factor ** multiplicity, prime)
+                # the factors are irreducible: x^(p^d) = x modulo a factor of degree d
+                x = ModuloPolynomial("x", prime)
+                self.assertEqual(x.powmod(1, factor), x.powmod(prime ** factor.deg(), factor))
+            self.assertEqual(ModuloPolynomial(p, prime), product)
+        with self.assertRaises(ValueError):
+            ModuloPolynomial("x^2+1", 6).factor()
+
     def test_equality(self):
         self.assertEqual(0, ModuloPolynomial(0))
         self.assertEqual(ModuloPolynomial(0, 4), ModuloPolynomial(0, 6))
@@ -99,6 +481,43 @@ class RationalPolynomialTestCase(unittest.TestCase):
         rq = RationalPolynomial("x+4", "x-2")
         self.assertEqual(RationalPolynomial("2x^2+17/4x+15/2", "x^2-4"), rq + rp)
 
+    def test_lowest_terms(self):
+        r = RationalPolynomial("2x^2-2", "4x-4")
+        self.assertEqual(Polynomial("1/2x+1/2"), r.numerator)
+        self.assertEqual(Polynomial(1), r.denominator)
+        self.assertEqual(RationalPolynomial(0), RationalPolynomial("x", "x+1") - RationalPolynomial("x", "x+1"))
+        self.assertEqual(RationalPolynomial(1, "x+1"), RationalPolynomial("x", "x+1") / "x")
+        self.assertEqual(Polynomial("x-1"), (RationalPolynomial("x^2", "x+1") - RationalPolynomial(1, "x+1")).numerator)
+        with self.assertRaises(ZeroDivisionError):
+            RationalPolynomial("x", 0)
+        # the sum of the 1/((x+k)(x+k+1)) = 1/(x+k) - 1/(x+k+1) telescopes
+        for lazy in (False, True):
+            r = RationalPolynomial(0, lazy=lazy)
+            for k in range(1, 50):
+                r = r + RationalPolynomial("x+3", Polynomial(f"x+{k}") * Polynomial(f"x+{k + 1}") * Polynomial("x+3"))
+            self.assertLessEqual(r.numerator.deg() + r.denominator.deg(), 2 if not lazy else 40)
+            r = r.reduce()
+            self.assertEqual(Polynomial(49), r.numerator)
+            self.assertEqual(Polynomial("x^2+51x+50"), r.denominator)
+
+
+class PolynomialParserTestCase(unittest.TestCase):
+    def test_composition(self):
+        parser = PolynomialParser()
+        parser.parse("p = x^2+1")
+        parser.parse("q = x-1")
+        self.assertEqual("x^2-2x+2", parser.parse("p(q)").strip())
+        self.assertEqual("x^4+2x^2+2", parser.parse("p(p)").strip())
+        self.assertEqual("5", parser.parse("p(2)").strip())
+
+    def test_invalid_calls(self):
+        parser = PolynomialParser()
+        parser.parse("p = x^2")
+        self.assertEqual("Unknown function 'foo'", parser.parse("foo(2)").strip())
+        self.assertEqual("Unknown function 'q'", parser.parse("q(x+1)").strip())
+        self.assertEqual("A polynomial takes exactly one argument, 2 given", parser.parse("p(1,2)").strip())
+        self.assertEqual("1.0", parser.parse("cos(0)").strip())
+
 
 if __name__ == '__main__':
     unittest.main()